@@ -39,7 +39,6 @@ extensions = [
     "sphinx.ext.intersphinx",
     "sphinx.ext.viewcode",
     "sphinx.ext.napoleon",
-    "sphinx.ext.todo",
     # Third-party extensions
     "sphinx_copybutton",
     "sphinx_autodoc_typehints",
@@ -97,7 +96,7 @@ napoleon_use_ivar = True  # Use :ivar: for instance attributes to avoid duplicat
 napoleon_use_param = True
 napoleon_use_rtype = True
 napoleon_use_keyword = True
-napoleon_preprocess_types = True
+napoleon_preprocess_types = False  # sphinx-autodoc-typehints renders the types from annotations
 napoleon_attr_annotations = True
 
 # Autodoc settings
@@ -120,7 +119,6 @@ autosummary_generate = True
 
 # sphinx-autodoc-typehints settings
 typehints_fully_qualified = False
-always_document_param_types = True
 typehints_document_rtype = True
 typehints_use_rtype = True
 
@@ -131,6 +129,9 @@ intersphinx_mapping = {
     "hypothesis": ("https://hypothesis.readthedocs.io/en/latest/", None),
     "litestar": ("https://docs.litestar.dev/2/", None),
 }
+# Sphinx fetches the inventories concurrently, so a cold build waits on the slowest one;
+# cap each fetch so a stalled mirror cannot hold up the whole build.
+intersphinx_timeout = 10
 
 # MyST-Parser settings (Markdown support)
 myst_enable_extensions = [
@@ -154,9 +155,6 @@ copybutton_prompt_text = r">>> |\.\.\. |\$ |In \[\d*\]: | {2,5}\.\.\.: | {5,8}:
 copybutton_prompt_is_regexp = True
 copybutton_remove_prompts = True
 
-# TODO extension settings
-todo_include_todos = True
-
 # Suppress warnings for missing references in external packages
 # and duplicate object descriptions (from dataclass fields documented via napoleon Attributes section)
 suppress_warnings = [
@@ -18,7 +18,7 @@ from pytest_routes import (
 
 
 # Example 1: Basic registration
-@dataclass
+@dataclass(slots=True)
 class User:
     """User model."""
 
@@ -27,20 +27,21 @@ class User:
     age: int
 
 
+# Strategies are immutable, so build them once and reuse them on every registration.
+USER_STRATEGY = st.builds(
+    User,
+    username=st.text(min_size=3, max_size=20),
+    email=st.emails(),
+    age=st.integers(min_value=18, max_value=100),
+)
+
+
 def example_basic_registration() -> None:
     """Demonstrate basic strategy registration."""
     print("\n=== Example 1: Basic Registration ===")
 
     # Register a strategy for the User type
-    register_strategy(
-        User,
-        st.builds(
-            User,
-            username=st.text(min_size=3, max_size=20),
-            email=st.emails(),
-            age=st.integers(min_value=18, max_value=100),
-        ),
-    )
+    register_strategy(User, USER_STRATEGY)
 
     # Get and use the strategy
     strategy = strategy_for_type(User)
@@ -56,7 +57,7 @@ def example_override_protection() -> None:
     """Demonstrate override protection."""
     print("\n=== Example 2: Override Protection ===")
 
-    @dataclass
+    @dataclass(slots=True)
     class Product:
         """Product model."""
 
@@ -83,7 +84,7 @@ def example_override_protection() -> None:
 
 
 # Example 3: Decorator-based registration
-@dataclass
+@dataclass(slots=True)
 class Order:
     """Order model."""
 
@@ -137,7 +138,7 @@ def example_batch_registration() -> None:
     """Demonstrate batch strategy registration."""
     print("\n=== Example 5: Batch Registration ===")
 
-    @dataclass
+    @dataclass(slots=True)
     class Address:
         """Address model."""
 
@@ -145,14 +146,14 @@ def example_batch_registration() -> None:
         city: str
         zip_code: str
 
-    @dataclass
+    @dataclass(slots=True)
     class Company:
         """Company model."""
 
         name: str
         employees: int
 
-    @dataclass
+    @dataclass(slots=True)
     class Invoice:
         """Invoice model."""
 
@@ -199,13 +200,13 @@ def example_inspect_registered_types() -> None:
     """Demonstrate inspecting registered types."""
     print("\n=== Example 6: Inspect Registered Types ===")
 
-    @dataclass
+    @dataclass(slots=True)
     class CustomType1:
         """Custom type 1."""
 
         value: int
 
-    @dataclass
+    @dataclass(slots=True)
     class CustomType2:
         """Custom type 2."""
 
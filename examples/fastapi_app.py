@@ -5,6 +5,8 @@ Includes WebSocket routes for v0.4.0 WebSocket testing demonstration.
 
 from __future__ import annotations
 
+import itertools
+
 from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect
 from pydantic import BaseModel
 
@@ -38,7 +40,18 @@ users_db: dict[int, User] = {
     1: User(id=1, name="Alice", email="alice@example.com"),
     2: User(id=2, name="Bob", email="bob@example.com"),
 }
-next_id = 3
+_next_id = itertools.count(3).__next__
+
+# Snapshot of ``users_db.values()`` served by ``list_users``; reset whenever a user is added or removed.
+_users_cache: list[User] | None = None
+
+
+def _all_users() -> list[User]:
+    """Return the cached list of users, rebuilding it after the set of users changed."""
+    global _users_cache
+    if _users_cache is None:
+        _users_cache = list(users_db.values())
+    return _users_cache
 
 
 @app.get("/")
@@ -56,34 +69,35 @@ async def health() -> dict[str, str]:
 @app.get("/users", tags=["users"])
 async def list_users() -> list[User]:
     """List all users."""
-    return list(users_db.values())
+    return _all_users()
 
 
 @app.get("/users/{user_id}", tags=["users"])
 async def get_user(user_id: int) -> User:
     """Get a user by ID."""
-    if user_id not in users_db:
+    user = users_db.get(user_id)
+    if user is None:
         raise HTTPException(status_code=404, detail=f"User {user_id} not found")
-    return users_db[user_id]
+    return user
 
 
 @app.post("/users", tags=["users"], status_code=201)
 async def create_user(data: CreateUser) -> User:
     """Create a new user."""
-    global next_id
-    user = User(id=next_id, name=data.name, email=data.email)
-    users_db[next_id] = user
-    next_id += 1
+    global _users_cache
+    user = User(id=_next_id(), name=data.name, email=data.email)
+    users_db[user.id] = user
+    _users_cache = None
     return user
 
 
 @app.patch("/users/{user_id}", tags=["users"])
 async def update_user(user_id: int, data: UpdateUser) -> User:
     """Update a user."""
-    if user_id not in users_db:
+    user = users_db.get(user_id)
+    if user is None:
         raise HTTPException(status_code=404, detail=f"User {user_id} not found")
 
-    user = users_db[user_id]
     if data.name is not None:
         user.name = data.name
     if data.email is not None:
@@ -94,9 +108,10 @@ async def update_user(user_id: int, data: UpdateUser) -> User:
 @app.delete("/users/{user_id}", tags=["users"], status_code=204)
 async def delete_user(user_id: int) -> None:
     """Delete a user."""
-    if user_id not in users_db:
+    global _users_cache
+    if users_db.pop(user_id, None) is None:
         raise HTTPException(status_code=404, detail=f"User {user_id} not found")
-    del users_db[user_id]
+    _users_cache = None
 
 
 @app.get("/items/{item_id}")
@@ -123,14 +138,12 @@ async def ws_chat(websocket: WebSocket, room_id: str) -> None:
     """Chat room WebSocket with path parameter."""
     await websocket.accept()
     await websocket.send_json({"type": "joined", "room": room_id})
+    # send_json serializes immediately, so one response dict can be reused per message.
+    response = {"type": "message", "room": room_id, "content": ""}
     try:
         while True:
             data = await websocket.receive_json()
-            response = {
-                "type": "message",
-                "room": room_id,
-                "content": data.get("content", ""),
-            }
+            response["content"] = data.get("content", "")
             await websocket.send_json(response)
     except WebSocketDisconnect:
         pass
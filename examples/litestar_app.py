@@ -6,11 +6,12 @@ Also includes WebSocket routes for v0.4.0 WebSocket testing demonstration.
 
 from __future__ import annotations
 
+import itertools
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
-from litestar import Controller, Litestar, delete, get, patch, post, websocket
-from litestar.exceptions import NotAuthorizedException
+from litestar import Controller, Litestar, WebSocket, delete, get, patch, post, websocket
+from litestar.exceptions import NotAuthorizedException, NotFoundException
 
 if TYPE_CHECKING:
     from litestar.connection import ASGIConnection
@@ -24,7 +25,7 @@ def require_auth(connection: ASGIConnection[Any, Any, Any], _: BaseRouteHandler)
         raise NotAuthorizedException("Authentication required")
 
 
-@dataclass
+@dataclass(slots=True)
 class User:
     """User model."""
 
@@ -33,7 +34,7 @@ class User:
     email: str
 
 
-@dataclass
+@dataclass(slots=True)
 class CreateUser:
     """Create user request body."""
 
@@ -41,7 +42,7 @@ class CreateUser:
     email: str
 
 
-@dataclass
+@dataclass(slots=True)
 class UpdateUser:
     """Update user request body."""
 
@@ -54,7 +55,18 @@ users_db: dict[int, User] = {
     1: User(id=1, name="Alice", email="alice@example.com"),
     2: User(id=2, name="Bob", email="bob@example.com"),
 }
-next_id = 3
+_next_id = itertools.count(3).__next__
+
+# Snapshot of ``users_db.values()`` served by ``list_users``; reset whenever a user is added or removed.
+_users_cache: list[User] | None = None
+
+
+def _all_users() -> list[User]:
+    """Return the cached list of users, rebuilding it after the set of users changed."""
+    global _users_cache
+    if _users_cache is None:
+        _users_cache = list(users_db.values())
+    return _users_cache
 
 
 @get("/")
@@ -78,35 +90,32 @@ class UsersController(Controller):
     @get("/")
     async def list_users(self) -> list[User]:
         """List all users."""
-        return list(users_db.values())
+        return _all_users()
 
     @get("/{user_id:int}")
     async def get_user(self, user_id: int) -> User:
         """Get a user by ID."""
-        if user_id not in users_db:
-            from litestar.exceptions import NotFoundException
-
+        user = users_db.get(user_id)
+        if user is None:
             raise NotFoundException(f"User {user_id} not found")
-        return users_db[user_id]
+        return user
 
     @post("/")
     async def create_user(self, data: CreateUser) -> User:
         """Create a new user."""
-        global next_id
-        user = User(id=next_id, name=data.name, email=data.email)
-        users_db[next_id] = user
-        next_id += 1
+        global _users_cache
+        user = User(id=_next_id(), name=data.name, email=data.email)
+        users_db[user.id] = user
+        _users_cache = None
         return user
 
     @patch("/{user_id:int}")
     async def update_user(self, user_id: int, data: UpdateUser) -> User:
         """Update a user."""
-        if user_id not in users_db:
-            from litestar.exceptions import NotFoundException
-
+        user = users_db.get(user_id)
+        if user is None:
             raise NotFoundException(f"User {user_id} not found")
 
-        user = users_db[user_id]
         if data.name is not None:
             user.name = data.name
         if data.email is not None:
@@ -116,11 +125,10 @@ class UsersController(Controller):
     @delete("/{user_id:int}")
     async def delete_user(self, user_id: int) -> None:
         """Delete a user."""
-        if user_id not in users_db:
-            from litestar.exceptions import NotFoundException
-
+        global _users_cache
+        if users_db.pop(user_id, None) is None:
             raise NotFoundException(f"User {user_id} not found")
-        del users_db[user_id]
+        _users_cache = None
 
 
 @get("/items/{item_id:int}")
@@ -143,7 +151,7 @@ async def get_protected_data() -> dict:
 
 # WebSocket routes for v0.4.0 demonstration
 @websocket("/ws/echo")
-async def ws_echo(socket: "litestar.WebSocket") -> None:
+async def ws_echo(socket: WebSocket) -> None:
     """Echo WebSocket - sends back whatever it receives."""
     await socket.accept()
     try:
@@ -157,18 +165,16 @@ async def ws_echo(socket: "litestar.WebSocket") -> None:
 
 
 @websocket("/ws/chat/{room_id:str}")
-async def ws_chat(socket: "litestar.WebSocket", room_id: str) -> None:
+async def ws_chat(socket: WebSocket, room_id: str) -> None:
     """Chat room WebSocket with path parameter."""
     await socket.accept()
     await socket.send_json({"type": "joined", "room": room_id})
+    # send_json serializes immediately, so one response dict can be reused per message.
+    response = {"type": "message", "room": room_id, "content": ""}
     try:
         while True:
             data = await socket.receive_json()
-            response = {
-                "type": "message",
-                "room": room_id,
-                "content": data.get("content", ""),
-            }
+            response["content"] = data.get("content", "")
             await socket.send_json(response)
     except Exception:
         pass
@@ -177,7 +183,7 @@ async def ws_chat(socket: "litestar.WebSocket", room_id: str) -> None:
 
 
 @websocket("/ws/notifications")
-async def ws_notifications(socket: "litestar.WebSocket") -> None:
+async def ws_notifications(socket: WebSocket) -> None:
     """Notifications WebSocket - server-push pattern."""
     await socket.accept()
     await socket.send_json({"type": "connected", "status": "ok"})
@@ -191,9 +197,6 @@ async def ws_notifications(socket: "litestar.WebSocket") -> None:
         await socket.close()
 
 
-# Import for WebSocket type hint
-import litestar
-
 app = Litestar(
     route_handlers=[
         root,
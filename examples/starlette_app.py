@@ -5,6 +5,8 @@ Includes WebSocket routes for v0.4.0 WebSocket testing demonstration.
 
 from __future__ import annotations
 
+import itertools
+
 from starlette.applications import Starlette
 from starlette.requests import Request
 from starlette.responses import JSONResponse, Response
@@ -16,69 +18,102 @@ users_db: dict[int, dict] = {
     1: {"id": 1, "name": "Alice", "email": "alice@example.com"},
     2: {"id": 2, "name": "Bob", "email": "bob@example.com"},
 }
-next_id = 3
+_next_id = itertools.count(3).__next__
+
+
+def _encode_json(content: dict | list) -> bytes:
+    """Encode ``content`` with ``JSONResponse`` so cached bodies match what it sends."""
+    return bytes(JSONResponse(content).body)
+
+
+# Encoded ``list_users`` payload; reset whenever a user is created, updated or deleted.
+_users_body: bytes | None = None
+
 
+def _all_users_body() -> bytes:
+    """Return the encoded list of users, re-encoding it after any change to ``users_db``."""
+    global _users_body
+    if _users_body is None:
+        _users_body = _encode_json(list(users_db.values()))
+    return _users_body
 
-async def root(request: Request) -> JSONResponse:
+
+# Static payloads are encoded once at import instead of on every request.
+_ROOT_BODY = _encode_json({"message": "Welcome to the pytest-routes example API!"})
+_HEALTH_BODY = _encode_json({"status": "healthy"})
+_USER_NOT_FOUND_BODY = b'{"detail":"User %d not found"}'
+
+
+def _user_not_found(user_id: int) -> Response:
+    """Build the 404 response shared by the user handlers."""
+    return Response(_USER_NOT_FOUND_BODY % user_id, status_code=404, media_type="application/json")
+
+
+async def root(request: Request) -> Response:
     """Root endpoint."""
-    return JSONResponse({"message": "Welcome to the pytest-routes example API!"})
+    return Response(_ROOT_BODY, media_type="application/json")
 
 
-async def health(request: Request) -> JSONResponse:
+async def health(request: Request) -> Response:
     """Health check endpoint."""
-    return JSONResponse({"status": "healthy"})
+    return Response(_HEALTH_BODY, media_type="application/json")
 
 
-async def list_users(request: Request) -> JSONResponse:
+async def list_users(request: Request) -> Response:
     """List all users."""
-    return JSONResponse(list(users_db.values()))
+    return Response(_all_users_body(), media_type="application/json")
 
 
-async def get_user(request: Request) -> JSONResponse:
+async def get_user(request: Request) -> Response:
     """Get a user by ID."""
-    user_id = int(request.path_params["user_id"])
-    if user_id not in users_db:
-        return JSONResponse({"detail": f"User {user_id} not found"}, status_code=404)
-    return JSONResponse(users_db[user_id])
+    user_id = request.path_params["user_id"]
+    user = users_db.get(user_id)
+    if user is None:
+        return _user_not_found(user_id)
+    return JSONResponse(user)
 
 
 async def create_user(request: Request) -> JSONResponse:
     """Create a new user."""
-    global next_id
+    global _users_body
     data = await request.json()
-    user = {"id": next_id, "name": data["name"], "email": data["email"]}
-    users_db[next_id] = user
-    next_id += 1
+    user_id = _next_id()
+    user = {"id": user_id, "name": data["name"], "email": data["email"]}
+    users_db[user_id] = user
+    _users_body = None
     return JSONResponse(user, status_code=201)
 
 
-async def update_user(request: Request) -> JSONResponse:
+async def update_user(request: Request) -> Response:
     """Update a user."""
-    user_id = int(request.path_params["user_id"])
-    if user_id not in users_db:
-        return JSONResponse({"detail": f"User {user_id} not found"}, status_code=404)
+    global _users_body
+    user_id = request.path_params["user_id"]
+    user = users_db.get(user_id)
+    if user is None:
+        return _user_not_found(user_id)
 
     data = await request.json()
-    user = users_db[user_id]
     if "name" in data and data["name"] is not None:
         user["name"] = data["name"]
     if "email" in data and data["email"] is not None:
         user["email"] = data["email"]
+    _users_body = None
     return JSONResponse(user)
 
 
 async def delete_user(request: Request) -> Response:
     """Delete a user."""
-    user_id = int(request.path_params["user_id"])
-    if user_id not in users_db:
-        return JSONResponse({"detail": f"User {user_id} not found"}, status_code=404)
-    del users_db[user_id]
+    global _users_body
+    user_id = request.path_params["user_id"]
+    if users_db.pop(user_id, None) is None:
+        return _user_not_found(user_id)
+    _users_body = None
     return Response(status_code=204)
 
 
 async def get_item(request: Request) -> JSONResponse:
     """Get an item with optional query parameter."""
-    item_id = int(request.path_params["item_id"])
+    item_id = request.path_params["item_id"]
     q = request.query_params.get("q")
     return JSONResponse({"item_id": item_id, "query": q})
 
@@ -100,14 +135,12 @@ async def ws_chat(websocket: WebSocket) -> None:
     room_id = websocket.path_params.get("room_id", "default")
     await websocket.accept()
     await websocket.send_json({"type": "joined", "room": room_id})
+    # send_json serializes immediately, so one response dict can be reused per message.
+    response = {"type": "message", "room": room_id, "content": ""}
     try:
         while True:
             data = await websocket.receive_json()
-            response = {
-                "type": "message",
-                "room": room_id,
-                "content": data.get("content", ""),
-            }
+            response["content"] = data.get("content", "")
             await websocket.send_json(response)
     except WebSocketDisconnect:
         pass
@@ -125,7 +158,7 @@ async def ws_notifications(websocket: WebSocket) -> None:
         pass
 
 
-routes = [
+routes = (
     Route("/", root, methods=["GET"]),
     Route("/health", health, methods=["GET"]),
     Route("/users", list_users, methods=["GET"]),
@@ -138,6 +171,6 @@ routes = [
     WebSocketRoute("/ws/echo", ws_echo),
     WebSocketRoute("/ws/chat/{room_id}", ws_chat),
     WebSocketRoute("/ws/notifications", ws_notifications),
-]
+)
 
 app = Starlette(routes=routes, debug=True)
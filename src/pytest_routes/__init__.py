@@ -2,132 +2,158 @@
 
 from __future__ import annotations
 
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from pytest_routes.__metadata__ import __version__
-from pytest_routes.auth import (
-    APIKeyAuth,
-    AuthProvider,
-    BearerTokenAuth,
-    CompositeAuth,
-    NoAuth,
-)
-from pytest_routes.config import (
-    ReportConfig,
-    RouteOverride,
-    RouteTestConfig,
-    SchemathesisConfig,
-    load_config_from_pyproject,
-    merge_configs,
-)
-from pytest_routes.discovery import get_extractor
-from pytest_routes.discovery.base import RouteExtractor, RouteInfo
-from pytest_routes.execution.client import RouteTestClient
-from pytest_routes.execution.runner import RouteTestFailure, RouteTestRunner
-from pytest_routes.generation.headers import (
-    generate_headers,
-    generate_optional_headers,
-    register_header_strategy,
-)
-from pytest_routes.generation.strategies import (
-    get_registered_types,
-    register_strategies,
-    register_strategy,
-    strategy_for_type,
-    strategy_provider,
-    temporary_strategy,
-    unregister_strategy,
-)
-from pytest_routes.integrations.schemathesis import (
-    SchemathesisAdapter,
-    SchemathesisValidator,
-    schemathesis_available,
-)
-from pytest_routes.reporting import (
-    CoverageMetrics,
-    HTMLReportGenerator,
-    RouteCoverage,
-    RouteMetrics,
-    RunMetrics,
-    aggregate_metrics,
-    calculate_coverage,
-)
-from pytest_routes.stateful import (
-    HookConfig,
-    LinkConfig,
-    StatefulTestConfig,
-    StatefulTestResult,
-    StatefulTestRunner,
-    TransitionRecord,
-)
-from pytest_routes.validation.response import (
-    CompositeValidator,
-    ContentTypeValidator,
-    JsonSchemaValidator,
-    OpenAPIResponseValidator,
-    ResponseValidator,
-    StatusCodeValidator,
-    ValidationResult,
-)
 
-__all__ = [
-    "__version__",
+if TYPE_CHECKING:
+    from pytest_routes.auth import (
+        APIKeyAuth,
+        AuthProvider,
+        BearerTokenAuth,
+        CompositeAuth,
+        NoAuth,
+    )
+    from pytest_routes.config import (
+        ReportConfig,
+        RouteOverride,
+        RouteTestConfig,
+        SchemathesisConfig,
+        load_config_from_pyproject,
+        merge_configs,
+    )
+    from pytest_routes.discovery import get_extractor
+    from pytest_routes.discovery.base import RouteExtractor, RouteInfo
+    from pytest_routes.execution.client import RouteTestClient
+    from pytest_routes.execution.runner import RouteTestFailure, RouteTestRunner
+    from pytest_routes.generation.headers import (
+        generate_headers,
+        generate_optional_headers,
+        register_header_strategy,
+    )
+    from pytest_routes.generation.strategies import (
+        get_registered_types,
+        register_strategies,
+        register_strategy,
+        strategy_for_type,
+        strategy_provider,
+        temporary_strategy,
+        unregister_strategy,
+    )
+    from pytest_routes.integrations.schemathesis import (
+        SchemathesisAdapter,
+        SchemathesisValidator,
+        schemathesis_available,
+    )
+    from pytest_routes.reporting import (
+        CoverageMetrics,
+        HTMLReportGenerator,
+        RouteCoverage,
+        RouteMetrics,
+        RunMetrics,
+        aggregate_metrics,
+        calculate_coverage,
+    )
+    from pytest_routes.stateful import (
+        HookConfig,
+        LinkConfig,
+        StatefulTestConfig,
+        StatefulTestResult,
+        StatefulTestRunner,
+        TransitionRecord,
+    )
+    from pytest_routes.validation.response import (
+        CompositeValidator,
+        ContentTypeValidator,
+        JsonSchemaValidator,
+        OpenAPIResponseValidator,
+        ResponseValidator,
+        StatusCodeValidator,
+        ValidationResult,
+    )
+
+# Public names are resolved on first access (PEP 562). The pytest plugin imports the
+# runner, generation and hypothesis itself, so this only defers the few subpackages
+# it loads on demand (reporting, stateful, integrations) - a small startup saving.
+_LAZY_IMPORTS: dict[str, str] = {
     # Auth
-    "APIKeyAuth",
-    "AuthProvider",
-    "BearerTokenAuth",
-    "CompositeAuth",
-    "NoAuth",
+    "APIKeyAuth": "pytest_routes.auth",
+    "AuthProvider": "pytest_routes.auth",
+    "BearerTokenAuth": "pytest_routes.auth",
+    "CompositeAuth": "pytest_routes.auth",
+    "NoAuth": "pytest_routes.auth",
     # Config
-    "ReportConfig",
-    "RouteOverride",
-    "RouteTestConfig",
-    "SchemathesisConfig",
-    "load_config_from_pyproject",
-    "merge_configs",
+    "ReportConfig": "pytest_routes.config",
+    "RouteOverride": "pytest_routes.config",
+    "RouteTestConfig": "pytest_routes.config",
+    "SchemathesisConfig": "pytest_routes.config",
+    "load_config_from_pyproject": "pytest_routes.config",
+    "merge_configs": "pytest_routes.config",
     # Discovery
-    "RouteExtractor",
-    "RouteInfo",
-    "get_extractor",
+    "RouteExtractor": "pytest_routes.discovery.base",
+    "RouteInfo": "pytest_routes.discovery.base",
+    "get_extractor": "pytest_routes.discovery",
     # Execution
-    "RouteTestClient",
-    "RouteTestFailure",
-    "RouteTestRunner",
+    "RouteTestClient": "pytest_routes.execution.client",
+    "RouteTestFailure": "pytest_routes.execution.runner",
+    "RouteTestRunner": "pytest_routes.execution.runner",
     # Generation - Strategies
-    "get_registered_types",
-    "register_strategies",
-    "register_strategy",
-    "strategy_for_type",
-    "strategy_provider",
-    "temporary_strategy",
-    "unregister_strategy",
+    "get_registered_types": "pytest_routes.generation.strategies",
+    "register_strategies": "pytest_routes.generation.strategies",
+    "register_strategy": "pytest_routes.generation.strategies",
+    "strategy_for_type": "pytest_routes.generation.strategies",
+    "strategy_provider": "pytest_routes.generation.strategies",
+    "temporary_strategy": "pytest_routes.generation.strategies",
+    "unregister_strategy": "pytest_routes.generation.strategies",
     # Generation - Headers
-    "generate_headers",
-    "generate_optional_headers",
-    "register_header_strategy",
+    "generate_headers": "pytest_routes.generation.headers",
+    "generate_optional_headers": "pytest_routes.generation.headers",
+    "register_header_strategy": "pytest_routes.generation.headers",
     # Validation
-    "CompositeValidator",
-    "ContentTypeValidator",
-    "JsonSchemaValidator",
-    "OpenAPIResponseValidator",
-    "ResponseValidator",
-    "StatusCodeValidator",
-    "ValidationResult",
+    "CompositeValidator": "pytest_routes.validation.response",
+    "ContentTypeValidator": "pytest_routes.validation.response",
+    "JsonSchemaValidator": "pytest_routes.validation.response",
+    "OpenAPIResponseValidator": "pytest_routes.validation.response",
+    "ResponseValidator": "pytest_routes.validation.response",
+    "StatusCodeValidator": "pytest_routes.validation.response",
+    "ValidationResult": "pytest_routes.validation.response",
     # Integrations
-    "SchemathesisAdapter",
-    "SchemathesisValidator",
-    "schemathesis_available",
+    "SchemathesisAdapter": "pytest_routes.integrations.schemathesis",
+    "SchemathesisValidator": "pytest_routes.integrations.schemathesis",
+    "schemathesis_available": "pytest_routes.integrations.schemathesis",
     # Reporting
-    "CoverageMetrics",
-    "HTMLReportGenerator",
-    "RouteCoverage",
-    "RouteMetrics",
-    "RunMetrics",
-    "aggregate_metrics",
-    "calculate_coverage",
+    "CoverageMetrics": "pytest_routes.reporting",
+    "HTMLReportGenerator": "pytest_routes.reporting",
+    "RouteCoverage": "pytest_routes.reporting",
+    "RouteMetrics": "pytest_routes.reporting",
+    "RunMetrics": "pytest_routes.reporting",
+    "aggregate_metrics": "pytest_routes.reporting",
+    "calculate_coverage": "pytest_routes.reporting",
     # Stateful Testing
-    "HookConfig",
-    "LinkConfig",
-    "StatefulTestConfig",
-    "StatefulTestResult",
-    "StatefulTestRunner",
-    "TransitionRecord",
-]
+    "HookConfig": "pytest_routes.stateful",
+    "LinkConfig": "pytest_routes.stateful",
+    "StatefulTestConfig": "pytest_routes.stateful",
+    "StatefulTestResult": "pytest_routes.stateful",
+    "StatefulTestRunner": "pytest_routes.stateful",
+    "TransitionRecord": "pytest_routes.stateful",
+}
+
+# Everything resolvable through _LAZY_IMPORTS is public
+__all__ = ["__version__", *_LAZY_IMPORTS]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public name from its defining module on first access and cache it."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """Include the not-yet-imported public names in ``dir(pytest_routes)``."""
+    return sorted({*globals(), *__all__})
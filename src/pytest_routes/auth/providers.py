@@ -75,6 +75,8 @@ class AuthProvider(ABC):
                     return {}
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def get_headers(self) -> dict[str, str]:
         """Get authentication headers.
@@ -108,6 +110,8 @@ class NoAuth(AuthProvider):
         {}
     """
 
+    __slots__ = ()
+
     def get_headers(self) -> dict[str, str]:
         """Return empty headers dict."""
         return {}
@@ -142,6 +146,8 @@ class BearerTokenAuth(AuthProvider):
             # {"Authorization": "Bearer my-secret-token"}
     """
 
+    __slots__ = ("_env_var", "_header_value", "_token_spec")
+
     def __init__(self, token: str) -> None:
         """Initialize Bearer token authentication.
 
@@ -150,6 +156,9 @@ class BearerTokenAuth(AuthProvider):
                 environment variable.
         """
         self._token_spec = token
+        self._env_var = token[1:] if token.startswith("$") else None
+        # A literal token never changes, so its header value is built once up front.
+        self._header_value = None if self._env_var is not None else f"Bearer {token}"
 
     @property
     def token(self) -> str:
@@ -161,14 +170,14 @@ class BearerTokenAuth(AuthProvider):
         Raises:
             ValueError: If an environment variable is specified but not set.
         """
-        if self._token_spec.startswith("$"):
-            env_var = self._token_spec[1:]
-            value = os.environ.get(env_var)
-            if value is None:
-                msg = f"Environment variable '{env_var}' is not set"
-                raise ValueError(msg)
-            return value
-        return self._token_spec
+        env_var = self._env_var
+        if env_var is None:
+            return self._token_spec
+        value = os.environ.get(env_var)
+        if value is None:
+            msg = f"Environment variable '{env_var}' is not set"
+            raise ValueError(msg)
+        return value
 
     def get_headers(self) -> dict[str, str]:
         """Get Authorization header with Bearer token.
@@ -176,7 +185,10 @@ class BearerTokenAuth(AuthProvider):
         Returns:
             Dictionary with Authorization header.
         """
-        return {"Authorization": f"Bearer {self.token}"}
+        header_value = self._header_value
+        if header_value is None:
+            header_value = f"Bearer {self.token}"
+        return {"Authorization": header_value}
 
     def get_query_params(self) -> dict[str, str]:
         """Return empty query params dict."""
@@ -216,6 +228,8 @@ class APIKeyAuth(AuthProvider):
             # {"api_key": "my-key"}
     """
 
+    __slots__ = ("_env_var", "_key_spec", "header_name", "query_param")
+
     def __init__(
         self,
         key: str,
@@ -231,6 +245,7 @@ class APIKeyAuth(AuthProvider):
             query_param: Query parameter name to use (e.g., "api_key").
         """
         self._key_spec = key
+        self._env_var = key[1:] if key.startswith("$") else None
         self.header_name = header_name
         self.query_param = query_param
 
@@ -248,14 +263,14 @@ class APIKeyAuth(AuthProvider):
         Raises:
             ValueError: If an environment variable is specified but not set.
         """
-        if self._key_spec.startswith("$"):
-            env_var = self._key_spec[1:]
-            value = os.environ.get(env_var)
-            if value is None:
-                msg = f"Environment variable '{env_var}' is not set"
-                raise ValueError(msg)
-            return value
-        return self._key_spec
+        env_var = self._env_var
+        if env_var is None:
+            return self._key_spec
+        value = os.environ.get(env_var)
+        if value is None:
+            msg = f"Environment variable '{env_var}' is not set"
+            raise ValueError(msg)
+        return value
 
     def get_headers(self) -> dict[str, str]:
         """Get API key header if configured.
@@ -263,8 +278,9 @@ class APIKeyAuth(AuthProvider):
         Returns:
             Dictionary with API key header, or empty dict if using query param.
         """
-        if self.header_name:
-            return {self.header_name: self.key}
+        header_name = self.header_name
+        if header_name:
+            return {header_name: self.key}
         return {}
 
     def get_query_params(self) -> dict[str, str]:
@@ -273,8 +289,9 @@ class APIKeyAuth(AuthProvider):
         Returns:
             Dictionary with API key query param, or empty dict if using header.
         """
-        if self.query_param:
-            return {self.query_param: self.key}
+        query_param = self.query_param
+        if query_param:
+            return {query_param: self.key}
         return {}
 
 
@@ -304,6 +321,8 @@ class CompositeAuth(AuthProvider):
             # {"Authorization": "Bearer my-token", "X-Tenant-ID": "tenant-123"}
     """
 
+    __slots__ = ("providers",)
+
     def __init__(self, providers: Sequence[AuthProvider]) -> None:
         """Initialize composite authentication.
 
@@ -318,8 +337,12 @@ class CompositeAuth(AuthProvider):
         Returns:
             Merged dictionary of headers from all providers.
         """
+        providers = self.providers
+        if len(providers) == 1:
+            # Skip the merge loop, but still copy: a provider may hand back a dict it keeps
+            return dict(providers[0].get_headers())
         headers: dict[str, str] = {}
-        for provider in self.providers:
+        for provider in providers:
             headers.update(provider.get_headers())
         return headers
 
@@ -329,7 +352,11 @@ class CompositeAuth(AuthProvider):
         Returns:
             Merged dictionary of query params from all providers.
         """
+        providers = self.providers
+        if len(providers) == 1:
+            # Skip the merge loop, but still copy: a provider may hand back a dict it keeps
+            return dict(providers[0].get_query_params())
         params: dict[str, str] = {}
-        for provider in self.providers:
+        for provider in providers:
             params.update(provider.get_query_params())
         return params
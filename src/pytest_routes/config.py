@@ -2,27 +2,73 @@
 
 from __future__ import annotations
 
+import copy
+import fnmatch
+import functools
+import os
+import re
 import sys
-from dataclasses import dataclass, field
+from dataclasses import MISSING, dataclass, field, fields
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Literal
 
-# Python 3.11+ has tomllib, earlier versions need tomli
-if sys.version_info >= (3, 11):
-    import tomllib
-else:
-    try:
-        import tomli as tomllib  # type: ignore[import-untyped]
-    except ImportError:
-        tomllib = None  # type: ignore[assignment]
-
 if TYPE_CHECKING:
+    from types import ModuleType
+
     from pytest_routes.auth.providers import AuthProvider
     from pytest_routes.stateful.config import StatefulTestConfig
     from pytest_routes.websocket.config import WebSocketTestConfig
 
 
-@dataclass
+# Defaults for RouteTestConfig list fields, materialized once per process
+_DEFAULT_EXCLUDE_PATTERNS = ("/health", "/metrics", "/openapi*", "/docs", "/redoc", "/schema")
+_DEFAULT_METHODS = ("GET", "POST", "PUT", "PATCH", "DELETE")
+_DEFAULT_ALLOWED_STATUS_CODES = tuple(range(200, 500))
+_DEFAULT_RESPONSE_VALIDATORS = ("status_code",)
+_DEFAULT_SCHEMATHESIS_CHECKS = (
+    "status_code_conformance",
+    "content_type_conformance",
+    "response_schema_conformance",
+)
+
+
+@functools.cache
+def _get_tomllib() -> ModuleType | None:
+    """Import the TOML parser on first use.
+
+    The plugin imports this module on every pytest run, so the parser is only
+    loaded once a pyproject.toml actually needs reading.
+
+    Returns:
+        The tomllib module (tomli on Python < 3.11), or None if unavailable.
+    """
+    # Python 3.11+ has tomllib, earlier versions need tomli
+    if sys.version_info >= (3, 11):
+        import tomllib
+    else:
+        try:
+            import tomli as tomllib  # type: ignore[import-untyped]
+        except ImportError:
+            return None
+    return tomllib
+
+
+@functools.lru_cache(maxsize=64)
+def _compile_patterns(patterns: tuple[str, ...]) -> re.Pattern[str] | None:
+    """Compile glob-like patterns into a single regex.
+
+    Args:
+        patterns: Glob patterns as accepted by fnmatch.
+
+    Returns:
+        A compiled pattern matching any of the globs, or None if there are none.
+    """
+    if not patterns:
+        return None
+    return re.compile("|".join(fnmatch.translate(os.path.normcase(p)) for p in patterns))
+
+
+@dataclass(slots=True)
 class RouteOverride:
     """Per-route configuration overrides.
 
@@ -53,7 +99,7 @@ class RouteOverride:
     allowed_status_codes: list[int] | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SchemathesisConfig:
     """Configuration for Schemathesis integration.
 
@@ -69,16 +115,10 @@ class SchemathesisConfig:
     schema_path: str = "/openapi.json"
     validate_responses: bool = True
     stateful: str = "none"
-    checks: list[str] = field(
-        default_factory=lambda: [
-            "status_code_conformance",
-            "content_type_conformance",
-            "response_schema_conformance",
-        ]
-    )
+    checks: list[str] = field(default_factory=lambda: list(_DEFAULT_SCHEMATHESIS_CHECKS))
 
 
-@dataclass
+@dataclass(slots=True)
 class ReportConfig:
     """Configuration for test reporting.
 
@@ -101,7 +141,7 @@ class ReportConfig:
     theme: str = "light"
 
 
-@dataclass
+@dataclass(slots=True)
 class RouteTestConfig:
     """Configuration for route smoke testing."""
 
@@ -111,23 +151,21 @@ class RouteTestConfig:
 
     # Route filtering
     include_patterns: list[str] = field(default_factory=list)
-    exclude_patterns: list[str] = field(
-        default_factory=lambda: ["/health", "/metrics", "/openapi*", "/docs", "/redoc", "/schema"]
-    )
-    methods: list[str] = field(default_factory=lambda: ["GET", "POST", "PUT", "PATCH", "DELETE"])
+    exclude_patterns: list[str] = field(default_factory=lambda: list(_DEFAULT_EXCLUDE_PATTERNS))
+    methods: list[str] = field(default_factory=lambda: list(_DEFAULT_METHODS))
 
     # Generation strategy
     strategy: Literal["random", "openapi", "hybrid"] = "hybrid"
     seed: int | None = None
 
     # Validation
-    allowed_status_codes: list[int] = field(default_factory=lambda: list(range(200, 500)))
+    allowed_status_codes: list[int] = field(default_factory=lambda: list(_DEFAULT_ALLOWED_STATUS_CODES))
     fail_on_5xx: bool = True
     fail_on_validation_error: bool = True
 
     # Response validation
     validate_responses: bool = False
-    response_validators: list[str] = field(default_factory=lambda: ["status_code"])
+    response_validators: list[str] = field(default_factory=lambda: list(_DEFAULT_RESPONSE_VALIDATORS))
 
     # Framework hints
     framework: Literal["auto", "litestar", "fastapi", "starlette"] | None = "auto"
@@ -153,6 +191,31 @@ class RouteTestConfig:
     # WebSocket testing (lazy import to avoid circular dependency)
     websocket: WebSocketTestConfig | None = None
 
+    def matches_exclude(self, path: str) -> bool:
+        """Check whether a route path matches any exclude pattern.
+
+        Args:
+            path: The route path to match.
+
+        Returns:
+            True if the path matches at least one exclude pattern.
+        """
+        pattern = _compile_patterns(tuple(self.exclude_patterns))
+        return pattern is not None and pattern.match(os.path.normcase(path)) is not None
+
+    def matches_include(self, path: str) -> bool:
+        """Check whether a route path matches any include pattern.
+
+        Args:
+            path: The route path to match.
+
+        Returns:
+            True if the path matches at least one include pattern. Always
+            False when no include patterns are configured.
+        """
+        pattern = _compile_patterns(tuple(self.include_patterns))
+        return pattern is not None and pattern.match(os.path.normcase(path)) is not None
+
     def get_override_for_route(self, path: str) -> RouteOverride | None:
         """Get the matching override for a route path.
 
@@ -165,8 +228,6 @@ class RouteTestConfig:
         Returns:
             The first matching RouteOverride, or None if no match.
         """
-        import fnmatch
-
         for override in self.route_overrides:
             if fnmatch.fnmatch(path, override.pattern):
                 return override
@@ -231,49 +292,47 @@ class RouteTestConfig:
             >>> config.max_examples
             50
         """
-        # Use defaults for missing values
-        defaults = cls()
+        # Only pass keys that are present so each default factory runs once
+        kwargs: dict[str, Any] = {dest: data[src] for src, dest in _FIELD_ALIASES.items() if src in data}
 
         # Parse auth configuration if present
-        auth = _parse_auth_config(data.get("auth"))
+        kwargs["auth"] = _parse_auth_config(data.get("auth"))
 
         # Parse route overrides if present
-        route_overrides = _parse_route_overrides(data.get("routes", []))
+        kwargs["route_overrides"] = _parse_route_overrides(data.get("routes", []))
 
         # Parse schemathesis configuration if present
-        schemathesis = _parse_schemathesis_config(data.get("schemathesis", {}))
+        kwargs["schemathesis"] = _parse_schemathesis_config(data.get("schemathesis", {}))
 
         # Parse report configuration if present
-        report = _parse_report_config(data.get("report", {}))
+        kwargs["report"] = _parse_report_config(data.get("report", {}))
 
         # Parse stateful configuration if present
-        stateful = _parse_stateful_config(data.get("stateful", {}))
+        kwargs["stateful"] = _parse_stateful_config(data.get("stateful", {}))
 
         # Parse WebSocket configuration if present
-        websocket = _parse_websocket_config(data.get("websocket", {}))
-
-        return cls(
-            max_examples=data.get("max_examples", defaults.max_examples),
-            timeout_per_route=data.get("timeout", defaults.timeout_per_route),
-            include_patterns=data.get("include", defaults.include_patterns),
-            exclude_patterns=data.get("exclude", defaults.exclude_patterns),
-            methods=data.get("methods", defaults.methods),
-            strategy=data.get("strategy", defaults.strategy),
-            seed=data.get("seed", defaults.seed),
-            allowed_status_codes=data.get("allowed_status_codes", defaults.allowed_status_codes),
-            fail_on_5xx=data.get("fail_on_5xx", defaults.fail_on_5xx),
-            fail_on_validation_error=data.get("fail_on_validation_error", defaults.fail_on_validation_error),
-            validate_responses=data.get("validate_responses", defaults.validate_responses),
-            response_validators=data.get("response_validators", defaults.response_validators),
-            framework=data.get("framework", defaults.framework),
-            verbose=data.get("verbose", defaults.verbose),
-            auth=auth,
-            route_overrides=route_overrides,
-            schemathesis=schemathesis,
-            report=report,
-            stateful=stateful,
-            websocket=websocket,
-        )
+        kwargs["websocket"] = _parse_websocket_config(data.get("websocket", {}))
+
+        return cls(**kwargs)
+
+
+# pyproject.toml key -> RouteTestConfig field for values copied through as-is
+_FIELD_ALIASES: dict[str, str] = {
+    "max_examples": "max_examples",
+    "timeout": "timeout_per_route",
+    "include": "include_patterns",
+    "exclude": "exclude_patterns",
+    "methods": "methods",
+    "strategy": "strategy",
+    "seed": "seed",
+    "allowed_status_codes": "allowed_status_codes",
+    "fail_on_5xx": "fail_on_5xx",
+    "fail_on_validation_error": "fail_on_validation_error",
+    "validate_responses": "validate_responses",
+    "response_validators": "response_validators",
+    "framework": "framework",
+    "verbose": "verbose",
+}
 
 
 def _parse_auth_config(auth_data: dict[str, Any] | None) -> AuthProvider | None:
@@ -389,15 +448,7 @@ def _parse_schemathesis_config(data: dict[str, Any]) -> SchemathesisConfig:
         stateful = "links"
         checks = ["status_code_conformance", "response_schema_conformance"]
     """
-    defaults = SchemathesisConfig()
-
-    return SchemathesisConfig(
-        enabled=data.get("enabled", defaults.enabled),
-        schema_path=data.get("schema_path", defaults.schema_path),
-        validate_responses=data.get("validate_responses", defaults.validate_responses),
-        stateful=data.get("stateful", defaults.stateful),
-        checks=data.get("checks", defaults.checks),
-    )
+    return SchemathesisConfig(**{f.name: data[f.name] for f in fields(SchemathesisConfig) if f.name in data})
 
 
 def _parse_report_config(data: dict[str, Any]) -> ReportConfig:
@@ -420,17 +471,7 @@ def _parse_report_config(data: dict[str, Any]) -> ReportConfig:
         include_timing = true
         theme = "dark"
     """
-    defaults = ReportConfig()
-
-    return ReportConfig(
-        enabled=data.get("enabled", defaults.enabled),
-        output_path=data.get("output_path", defaults.output_path),
-        json_output=data.get("json_output", defaults.json_output),
-        title=data.get("title", defaults.title),
-        include_coverage=data.get("include_coverage", defaults.include_coverage),
-        include_timing=data.get("include_timing", defaults.include_timing),
-        theme=data.get("theme", defaults.theme),
-    )
+    return ReportConfig(**{f.name: data[f.name] for f in fields(ReportConfig) if f.name in data})
 
 
 def _parse_stateful_config(data: dict[str, Any]) -> StatefulTestConfig | None:
@@ -492,9 +533,62 @@ def _parse_websocket_config(data: dict[str, Any]) -> WebSocketTestConfig | None:
     return WebSocketTestConfig.from_dict(data)
 
 
+# Parsed [tool.pytest-routes] sections keyed by resolved path, stored as (mtime_ns, size, section)
+_PYPROJECT_CACHE: dict[str, tuple[int, int, dict[str, Any]]] = {}
+
+
+def _read_pyproject_section(path: Path) -> dict[str, Any]:
+    """Read the [tool.pytest-routes] section of a pyproject.toml file.
+
+    The parsed section is cached per file and reused until the file's
+    modification time or size changes. Callers must not mutate the result.
+
+    Args:
+        path: Path to pyproject.toml file.
+
+    Returns:
+        The raw section, or an empty dict if the file or section is missing.
+
+    Raises:
+        ImportError: If tomllib/tomli is not available (Python < 3.11 and tomli not installed).
+        ValueError: If pyproject.toml cannot be parsed.
+    """
+    tomllib = _get_tomllib()
+    if tomllib is None:
+        msg = "tomllib is not available. For Python < 3.11, install tomli: pip install tomli"
+        raise ImportError(msg)
+
+    try:
+        stat = path.stat()
+    except OSError:
+        return {}
+
+    # The plugin reads the same file more than once per session, so reuse the
+    # parsed section until the file changes on disk; a changed file replaces its entry
+    key = str(path.resolve())
+    cached = _PYPROJECT_CACHE.get(key)
+    if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+        return cached[2]
+
+    try:
+        data = tomllib.loads(path.read_bytes().decode("utf-8"))
+    except Exception as e:
+        msg = f"Failed to parse pyproject.toml: {e}"
+        raise ValueError(msg) from e
+
+    # Extract [tool.pytest-routes] section
+    config_data = data.get("tool", {}).get("pytest-routes", {})
+    _PYPROJECT_CACHE[key] = (stat.st_mtime_ns, stat.st_size, config_data)
+    return config_data
+
+
 def load_config_from_pyproject(path: Path | None = None) -> RouteTestConfig:
     """Load configuration from pyproject.toml [tool.pytest-routes] section.
 
+    The parsed section is cached per file and reused until the file's
+    modification time or size changes. Each call still returns a new
+    RouteTestConfig instance.
+
     Args:
         path: Path to pyproject.toml file. If None, looks in current working directory.
 
@@ -511,32 +605,79 @@ def load_config_from_pyproject(path: Path | None = None) -> RouteTestConfig:
         >>> # Load from specific path
         >>> config = load_config_from_pyproject(Path("/path/to/pyproject.toml"))
     """
-    if tomllib is None:
-        msg = "tomllib is not available. For Python < 3.11, install tomli: pip install tomli"
-        raise ImportError(msg)
-
     if path is None:
         path = Path.cwd() / "pyproject.toml"
 
-    if not path.exists():
-        # Return defaults if file doesn't exist
+    config_data = _read_pyproject_section(path)
+
+    if not config_data:
+        # No file or configuration section found, return defaults
         return RouteTestConfig()
 
-    try:
-        with path.open("rb") as f:
-            data = tomllib.load(f)
-    except Exception as e:
-        msg = f"Failed to parse pyproject.toml: {e}"
-        raise ValueError(msg) from e
+    # Configs are mutable, so never hand out lists shared with the cache
+    return RouteTestConfig.from_dict(copy.deepcopy(config_data))
 
-    # Extract [tool.pytest-routes] section
-    config_data = data.get("tool", {}).get("pytest-routes", {})
 
-    if not config_data:
-        # No configuration section found, return defaults
-        return RouteTestConfig()
+def load_app_path_from_pyproject(path: Path | None = None) -> str | None:
+    """Load the ASGI app import path from pyproject.toml [tool.pytest-routes] section.
+
+    Shares the parsed-section cache with load_config_from_pyproject.
+
+    Args:
+        path: Path to pyproject.toml file. If None, looks in current working directory.
+
+    Returns:
+        The configured ``app`` value (e.g. "myapp.main:app"), or None if not set.
+
+    Raises:
+        ImportError: If tomllib/tomli is not available (Python < 3.11 and tomli not installed).
+        ValueError: If pyproject.toml cannot be parsed.
+    """
+    if path is None:
+        path = Path.cwd() / "pyproject.toml"
+
+    return _read_pyproject_section(path).get("app")
+
+
+def _field_defaults(cls: type) -> dict[str, Any]:
+    """Return the default value of every field of a dataclass.
+
+    Args:
+        cls: The dataclass type.
+
+    Returns:
+        Mapping of field name to its default value.
+    """
+    return {f.name: f.default_factory() if f.default_factory is not MISSING else f.default for f in fields(cls)}
+
+
+def _merge_fields(cli_config: Any, file_config: Any, defaults: dict[str, Any]) -> dict[str, Any]:
+    """Pick each field from the CLI config if it differs from its default, otherwise from the file config.
+
+    Args:
+        cli_config: Configuration from CLI options.
+        file_config: Configuration from pyproject.toml.
+        defaults: Default values of the fields to merge.
+
+    Returns:
+        Mapping of field name to merged value.
+    """
+    merged: dict[str, Any] = {}
+    for name, default in defaults.items():
+        cli_value = getattr(cli_config, name)
+        merged[name] = cli_value if cli_value != default else getattr(file_config, name)
+    return merged
+
 
-    return RouteTestConfig.from_dict(config_data)
+# Fields with their own merge rules in merge_configs
+_CUSTOM_MERGE_FIELDS = frozenset({"auth", "route_overrides", "schemathesis", "report", "stateful", "websocket"})
+
+# Defaults used only for comparison while merging; never handed out
+_MERGE_DEFAULTS = {
+    name: value for name, value in _field_defaults(RouteTestConfig).items() if name not in _CUSTOM_MERGE_FIELDS
+}
+_SCHEMATHESIS_DEFAULTS = _field_defaults(SchemathesisConfig)
+_REPORT_DEFAULTS = _field_defaults(ReportConfig)
 
 
 def merge_configs(
@@ -566,83 +707,22 @@ def merge_configs(
         >>> merged.seed  # From file
         123
     """
-    # Start with defaults
-    defaults = RouteTestConfig()
-
     # If no configs provided, return defaults
     if cli_config is None and file_config is None:
-        return defaults
+        return RouteTestConfig()
 
     # If only file config, return it
     if cli_config is None:
-        return file_config or defaults
+        return file_config or RouteTestConfig()
 
     # If only CLI config, return it
     if file_config is None:
         return cli_config
 
-    # Helper to check if a list is the "default" value (empty list)
-    def _is_default_list(value: list, default: list) -> bool:
-        """Check if a list value is considered a default."""
-        # For include_patterns, default is []
-        # For exclude_patterns, default is ["/health", ...]
-        # For methods, default is ["GET", "POST", ...]
-        # Empty list is only "default" for include_patterns
-        if not value:  # Empty list
-            return not default  # Empty is default only if default is also empty
-        return value == default
-
     # Merge: CLI takes precedence over file, file over defaults
-    # For each field, use CLI if it differs from default, otherwise use file
+    # For each plain field, use CLI if it differs from default, otherwise use file
     return RouteTestConfig(
-        max_examples=(
-            cli_config.max_examples if cli_config.max_examples != defaults.max_examples else file_config.max_examples
-        ),
-        timeout_per_route=(
-            cli_config.timeout_per_route
-            if cli_config.timeout_per_route != defaults.timeout_per_route
-            else file_config.timeout_per_route
-        ),
-        include_patterns=(
-            cli_config.include_patterns
-            if not _is_default_list(cli_config.include_patterns, defaults.include_patterns)
-            else file_config.include_patterns
-        ),
-        exclude_patterns=(
-            cli_config.exclude_patterns
-            if not _is_default_list(cli_config.exclude_patterns, defaults.exclude_patterns)
-            else file_config.exclude_patterns
-        ),
-        methods=(
-            cli_config.methods if not _is_default_list(cli_config.methods, defaults.methods) else file_config.methods
-        ),
-        strategy=(cli_config.strategy if cli_config.strategy != defaults.strategy else file_config.strategy),
-        seed=cli_config.seed if cli_config.seed is not None else file_config.seed,
-        allowed_status_codes=(
-            cli_config.allowed_status_codes
-            if not _is_default_list(cli_config.allowed_status_codes, defaults.allowed_status_codes)
-            else file_config.allowed_status_codes
-        ),
-        fail_on_5xx=(
-            cli_config.fail_on_5xx if cli_config.fail_on_5xx != defaults.fail_on_5xx else file_config.fail_on_5xx
-        ),
-        fail_on_validation_error=(
-            cli_config.fail_on_validation_error
-            if cli_config.fail_on_validation_error != defaults.fail_on_validation_error
-            else file_config.fail_on_validation_error
-        ),
-        validate_responses=(
-            cli_config.validate_responses
-            if cli_config.validate_responses != defaults.validate_responses
-            else file_config.validate_responses
-        ),
-        response_validators=(
-            cli_config.response_validators
-            if not _is_default_list(cli_config.response_validators, defaults.response_validators)
-            else file_config.response_validators
-        ),
-        framework=(cli_config.framework if cli_config.framework != defaults.framework else file_config.framework),
-        verbose=cli_config.verbose if cli_config.verbose != defaults.verbose else file_config.verbose,
+        **_merge_fields(cli_config, file_config, _MERGE_DEFAULTS),
         # Auth: CLI takes precedence if set
         auth=cli_config.auth if cli_config.auth is not None else file_config.auth,
         # Route overrides: merge both lists (CLI overrides first for pattern matching priority)
@@ -663,25 +743,7 @@ def _merge_schemathesis_config(
     file_config: SchemathesisConfig,
 ) -> SchemathesisConfig:
     """Merge schemathesis configs with CLI taking precedence."""
-    defaults = SchemathesisConfig()
-
-    enabled = cli_config.enabled if cli_config.enabled != defaults.enabled else file_config.enabled
-    schema_path = cli_config.schema_path if cli_config.schema_path != defaults.schema_path else file_config.schema_path
-    validate_responses = (
-        cli_config.validate_responses
-        if cli_config.validate_responses != defaults.validate_responses
-        else file_config.validate_responses
-    )
-    stateful = cli_config.stateful if cli_config.stateful != defaults.stateful else file_config.stateful
-    checks = cli_config.checks if cli_config.checks != defaults.checks else file_config.checks
-
-    return SchemathesisConfig(
-        enabled=enabled,
-        schema_path=schema_path,
-        validate_responses=validate_responses,
-        stateful=stateful,
-        checks=checks,
-    )
+    return SchemathesisConfig(**_merge_fields(cli_config, file_config, _SCHEMATHESIS_DEFAULTS))
 
 
 def _merge_report_config(
@@ -689,33 +751,7 @@ def _merge_report_config(
     file_config: ReportConfig,
 ) -> ReportConfig:
     """Merge report configs with CLI taking precedence."""
-    defaults = ReportConfig()
-
-    enabled = cli_config.enabled if cli_config.enabled != defaults.enabled else file_config.enabled
-    output_path = cli_config.output_path if cli_config.output_path != defaults.output_path else file_config.output_path
-    json_output = cli_config.json_output if cli_config.json_output is not None else file_config.json_output
-    title = cli_config.title if cli_config.title != defaults.title else file_config.title
-    include_coverage = (
-        cli_config.include_coverage
-        if cli_config.include_coverage != defaults.include_coverage
-        else file_config.include_coverage
-    )
-    include_timing = (
-        cli_config.include_timing
-        if cli_config.include_timing != defaults.include_timing
-        else file_config.include_timing
-    )
-    theme = cli_config.theme if cli_config.theme != defaults.theme else file_config.theme
-
-    return ReportConfig(
-        enabled=enabled,
-        output_path=output_path,
-        json_output=json_output,
-        title=title,
-        include_coverage=include_coverage,
-        include_timing=include_timing,
-        theme=theme,
-    )
+    return ReportConfig(**_merge_fields(cli_config, file_config, _REPORT_DEFAULTS))
 
 
 def _merge_stateful_config(
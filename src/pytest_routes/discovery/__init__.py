@@ -13,6 +13,10 @@ __all__ = [
 ]
 
 
+# Extractor class chosen for each app type seen so far
+_EXTRACTOR_BY_TYPE: dict[type, type[RouteExtractor]] = {}
+
+
 def get_extractor(app: Any) -> RouteExtractor:
     """Get the appropriate route extractor for an ASGI app.
 
@@ -25,6 +29,11 @@ def get_extractor(app: Any) -> RouteExtractor:
     Raises:
         ValueError: If no suitable extractor is found.
     """
+    # Extractors match on the app's class, so the result can be reused per type
+    cached_cls = _EXTRACTOR_BY_TYPE.get(type(app))
+    if cached_cls is not None:
+        return cached_cls()
+
     from pytest_routes.discovery.litestar import LitestarExtractor
     from pytest_routes.discovery.starlette import StarletteExtractor
 
@@ -36,6 +45,7 @@ def get_extractor(app: Any) -> RouteExtractor:
     for extractor_cls in extractors:
         extractor = extractor_cls()
         if extractor.supports(app):
+            _EXTRACTOR_BY_TYPE[type(app)] = extractor_cls
             return extractor
 
     msg = f"No route extractor found for app type: {type(app).__name__}"
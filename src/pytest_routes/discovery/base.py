@@ -17,7 +17,12 @@ class WebSocketMessageType(Enum):
     JSON = "json"
 
 
-@dataclass
+# Defaults for WebSocketMetadata list fields, shared by every instance's factory
+_DEFAULT_MESSAGE_TYPES = (WebSocketMessageType.TEXT, WebSocketMessageType.JSON)
+_DEFAULT_CLOSE_CODES = (1000, 1001)
+
+
+@dataclass(slots=True)
 class WebSocketMetadata:
     """Metadata specific to WebSocket routes.
 
@@ -40,19 +45,15 @@ class WebSocketMetadata:
     """
 
     subprotocols: list[str] = field(default_factory=list)
-    accepted_message_types: list[WebSocketMessageType] = field(
-        default_factory=lambda: [WebSocketMessageType.TEXT, WebSocketMessageType.JSON]
-    )
-    sends_message_types: list[WebSocketMessageType] = field(
-        default_factory=lambda: [WebSocketMessageType.TEXT, WebSocketMessageType.JSON]
-    )
+    accepted_message_types: list[WebSocketMessageType] = field(default_factory=lambda: list(_DEFAULT_MESSAGE_TYPES))
+    sends_message_types: list[WebSocketMessageType] = field(default_factory=lambda: list(_DEFAULT_MESSAGE_TYPES))
     auto_accept: bool = True
     ping_interval: float | None = None
     max_message_size: int | None = None
-    close_codes: list[int] = field(default_factory=lambda: [1000, 1001])
+    close_codes: list[int] = field(default_factory=lambda: list(_DEFAULT_CLOSE_CODES))
 
 
-@dataclass
+@dataclass(slots=True)
 class RouteInfo:
     """Normalized route information.
 
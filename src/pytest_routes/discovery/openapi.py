@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import functools
+import sys
 import uuid
 from dataclasses import make_dataclass
 from datetime import date, datetime
@@ -21,6 +23,38 @@ FORMAT_TYPE_MAP: dict[str, type] = {
     "ipv6": str,
 }
 
+# Mapping of JSON Schema types to Python types
+TYPE_MAP: dict[str, type] = {
+    "string": str,
+    "integer": int,
+    "number": float,
+    "boolean": bool,
+    "array": list,
+    "object": dict,
+}
+
+# HTTP methods that are turned into routes
+_HTTP_METHODS = frozenset({"GET", "POST", "PUT", "PATCH", "DELETE"})
+
+# Shared required-field set for object schemas that do not list any
+_NO_REQUIRED_FIELDS: frozenset[str] = frozenset()
+
+
+@functools.lru_cache(maxsize=512)
+def _optional(field_type: type) -> type:
+    """Return ``Union[field_type, None]``, memoized across generated fields.
+
+    ``typing.Union`` is kept rather than ``field_type | None`` because
+    ``strategy_for_type`` recognises optionals by ``get_origin(...) is Union``.
+
+    Args:
+        field_type: Type of a non-required field
+
+    Returns:
+        The optional form of the type
+    """
+    return Union[field_type, None]  # type: ignore[valid-type]  # noqa: UP007
+
 
 class OpenAPIExtractor(RouteExtractor):
     """Extract routes from an OpenAPI schema.
@@ -99,6 +133,12 @@ class OpenAPIExtractor(RouteExtractor):
         self.schema = schema
         self._type_cache: dict[str, type] = {}  # Cache for generated types
         self._generated_type_counter = 0  # Counter for unique generated type names
+        self._schema_app: Any = None  # App whose schema is held in _app_schema
+        self._app_schema: dict[str, Any] | None = None  # Schema generated from _schema_app
+        self._cached_schema: dict[str, Any] | None = None  # Schema the per-schema caches below belong to
+        self._ref_cache: dict[str, dict[str, Any]] = {}  # Resolved $ref targets by ref string
+        self._converted_types: dict[int, tuple[dict[str, Any], type]] = {}  # Converted types by id(schema)
+        self._building: set[int] = set()  # ids of object schemas whose dataclass is being built
 
     def supports(self, app: Any) -> bool:
         """Check if an OpenAPI schema can be extracted from the application.
@@ -214,18 +254,20 @@ class OpenAPIExtractor(RouteExtractor):
 
         for path, methods in schema.get("paths", {}).items():
             for method, operation in methods.items():
-                method_upper = method.upper()
-                if method_upper not in {"GET", "POST", "PUT", "PATCH", "DELETE"}:
+                # Share one string per method across all routes
+                method_upper = sys.intern(method.upper())
+                if method_upper not in _HTTP_METHODS:
                     continue
 
+                path_params, query_params = self._extract_params(operation, schema)
                 routes.append(
                     RouteInfo(
                         path=path,
                         methods=[method_upper],
                         name=operation.get("operationId"),
                         handler=None,
-                        path_params=self._extract_params(operation, "path", schema),
-                        query_params=self._extract_params(operation, "query", schema),
+                        path_params=path_params,
+                        query_params=query_params,
                         body_type=self._extract_body_type(operation, schema),
                         tags=operation.get("tags", []),
                         deprecated=operation.get("deprecated", False),
@@ -236,31 +278,46 @@ class OpenAPIExtractor(RouteExtractor):
         return routes
 
     def _get_schema(self, app: Any) -> dict[str, Any]:
-        """Extract OpenAPI schema from an app."""
+        """Extract OpenAPI schema from an app.
+
+        Generating the schema walks every handler and model, so the result is
+        kept and reused for later calls with the same app.
+        """
+        if self._app_schema is not None and self._schema_app is app:
+            return self._app_schema
+
         # Litestar
         if hasattr(app, "openapi_schema") and app.openapi_schema is not None:
-            return app.openapi_schema.to_schema()
-
+            schema = app.openapi_schema.to_schema()
         # FastAPI
-        if hasattr(app, "openapi"):
-            return app.openapi()
+        elif hasattr(app, "openapi"):
+            schema = app.openapi()
+        else:
+            msg = "Cannot extract OpenAPI schema from app"
+            raise ValueError(msg)
 
-        msg = "Cannot extract OpenAPI schema from app"
-        raise ValueError(msg)
+        self._schema_app = app
+        self._app_schema = schema
+        return schema
 
-    def _extract_params(self, operation: dict[str, Any], location: str, full_schema: dict[str, Any]) -> dict[str, type]:
-        """Extract parameters of a specific location from operation."""
-        params: dict[str, type] = {}
+    def _extract_params(
+        self, operation: dict[str, Any], full_schema: dict[str, Any]
+    ) -> tuple[dict[str, type], dict[str, type]]:
+        """Extract path and query parameters from operation in a single pass."""
+        path_params: dict[str, type] = {}
+        query_params: dict[str, type] = {}
+        by_location = {"path": path_params, "query": query_params}
 
         for param in operation.get("parameters", []):
-            if param.get("in") == location:
+            params = by_location.get(param.get("in"))
+            if params is not None:
                 name = param.get("name")
                 schema = param.get("schema", {})
                 param_type = self._schema_to_type_complex(schema, full_schema)
                 if name:
                     params[name] = param_type
 
-        return params
+        return path_params, query_params
 
     def _extract_body_type(self, operation: dict[str, Any], full_schema: dict[str, Any]) -> type | None:
         """Extract request body type from operation.
@@ -272,26 +329,43 @@ class OpenAPIExtractor(RouteExtractor):
         Returns:
             Python type representing the request body, or None if no body
         """
-        request_body = operation.get("requestBody", {})
-        content = request_body.get("content", {})
-        json_content = content.get("application/json", {})
-        body_schema = json_content.get("schema", {})
+        # Most operations (GET, DELETE) carry no body at all
+        request_body = operation.get("requestBody")
+        if not request_body:
+            return None
+
+        json_content = request_body.get("content", {}).get("application/json")
+        if not json_content:
+            return None
 
+        body_schema = json_content.get("schema")
         if not body_schema:
             return None
 
         # Handle $ref - preserve the ref name for caching
-        if "$ref" in body_schema:
-            ref_name = body_schema["$ref"].split("/")[-1]
-            # Check cache first
-            if ref_name in self._type_cache:
-                return self._type_cache[ref_name]
-            resolved_schema = self._resolve_ref(body_schema["$ref"], full_schema)
-            # Use the ref name for caching
-            return self._schema_to_dataclass(ref_name, resolved_schema, full_schema)
+        ref = body_schema.get("$ref")
+        if ref is not None:
+            return self._ref_to_dataclass(ref, full_schema)
 
         return self._schema_to_type_complex(body_schema, full_schema)
 
+    def _ref_to_dataclass(self, ref: str, full_schema: dict[str, Any]) -> type:
+        """Convert a $ref to a dataclass named after the referenced schema.
+
+        Args:
+            ref: Reference string (e.g., "#/components/schemas/User")
+            full_schema: Full OpenAPI schema for reference resolution
+
+        Returns:
+            Dataclass type, reused from the type cache when already generated
+        """
+        ref_name = ref.rpartition("/")[2]
+        # Check cache first so repeated refs skip resolution entirely
+        cached = self._type_cache.get(ref_name)
+        if cached is not None:
+            return cached
+        return self._schema_to_dataclass(ref_name, self._resolve_ref(ref, full_schema), full_schema)
+
     def _resolve_ref(self, ref: str, schema: dict[str, Any]) -> dict[str, Any]:
         """Resolve $ref to actual schema.
 
@@ -302,6 +376,12 @@ class OpenAPIExtractor(RouteExtractor):
         Returns:
             Resolved schema object
         """
+        # The same refs recur throughout a document, so remember each target
+        self._bind_schema_caches(schema)
+        cached = self._ref_cache.get(ref)
+        if cached is not None:
+            return cached
+
         if not ref.startswith("#/"):
             msg = f"Only local references are supported: {ref}"
             raise ValueError(msg)
@@ -317,8 +397,20 @@ class OpenAPIExtractor(RouteExtractor):
                 raise ValueError(msg)
             current = current[part]
 
+        self._ref_cache[ref] = current
         return current
 
+    def _bind_schema_caches(self, full_schema: dict[str, Any]) -> None:
+        """Reset the per-schema caches when work moves to a different OpenAPI schema.
+
+        Args:
+            full_schema: Full OpenAPI schema being resolved against
+        """
+        if full_schema is not self._cached_schema:
+            self._cached_schema = full_schema
+            self._ref_cache = {}
+            self._converted_types = {}
+
     def _schema_to_type(self, schema: dict[str, Any]) -> type:
         """Convert JSON schema to Python type (simple version for backward compatibility).
 
@@ -328,21 +420,34 @@ class OpenAPIExtractor(RouteExtractor):
         Returns:
             Python type
         """
-        schema_type = schema.get("type", "string")
+        return TYPE_MAP.get(schema.get("type", "string"), str)
 
-        type_map: dict[str, type] = {
-            "string": str,
-            "integer": int,
-            "number": float,
-            "boolean": bool,
-            "array": list,
-            "object": dict,
-        }
+    def _schema_to_type_complex(self, schema: dict[str, Any], full_schema: dict[str, Any]) -> type:
+        """Convert JSON schema to Python type with full support for complex types.
 
-        return type_map.get(schema_type, str)
+        Args:
+            schema: JSON schema object
+            full_schema: Full OpenAPI schema for reference resolution
 
-    def _schema_to_type_complex(self, schema: dict[str, Any], full_schema: dict[str, Any]) -> type:  # noqa: C901, PLR0911, PLR0912
-        """Convert JSON schema to Python type with full support for complex types.
+        Returns:
+            Python type (primitive, dataclass, or container type)
+        """
+        # Fast path for bare {"type": ...} leaves, the bulk of most specs
+        if len(schema) == 1 and "type" in schema:
+            return TYPE_MAP.get(schema["type"], str)
+
+        # Schema objects shared between operations are converted once per document.
+        # Entries keep a reference to their schema so its id cannot be reused.
+        self._bind_schema_caches(full_schema)
+        cached = self._converted_types.get(id(schema))
+        if cached is not None:
+            return cached[1]
+        converted = self._convert_schema(schema, full_schema)
+        self._converted_types[id(schema)] = (schema, converted)
+        return converted
+
+    def _convert_schema(self, schema: dict[str, Any], full_schema: dict[str, Any]) -> type:  # noqa: C901, PLR0911, PLR0912
+        """Convert a non-trivial JSON schema to a Python type.
 
         Args:
             schema: JSON schema object
@@ -352,18 +457,13 @@ class OpenAPIExtractor(RouteExtractor):
             Python type (primitive, dataclass, or container type)
         """
         # Handle $ref
-        if "$ref" in schema:
-            ref_name = schema["$ref"].split("/")[-1]
-            # Check cache first
-            if ref_name in self._type_cache:
-                return self._type_cache[ref_name]
-            resolved_schema = self._resolve_ref(schema["$ref"], full_schema)
-            # Pass the ref_name to _schema_to_dataclass for caching
-            return self._schema_to_dataclass(ref_name, resolved_schema, full_schema)
+        ref = schema.get("$ref")
+        if ref is not None:
+            return self._ref_to_dataclass(ref, full_schema)
 
         # Handle enum (use first enum type or string)
-        if "enum" in schema:
-            enum_values = schema["enum"]
+        enum_values = schema.get("enum")
+        if enum_values is not None:
             if enum_values:
                 # Use type of first value if available
                 first_val = enum_values[0]
@@ -371,35 +471,43 @@ class OpenAPIExtractor(RouteExtractor):
             return str
 
         # Handle allOf (simplified: use first schema)
-        if "allOf" in schema:
-            all_schemas = schema["allOf"]
+        all_schemas = schema.get("allOf")
+        if all_schemas is not None:
             if all_schemas:
                 # Merge properties from all schemas (simplified)
                 merged: dict[str, Any] = {"type": "object", "properties": {}}
                 for sub_schema in all_schemas:
-                    resolved = (
-                        self._resolve_ref(sub_schema["$ref"], full_schema) if "$ref" in sub_schema else sub_schema
-                    )
-                    if "properties" in resolved:
-                        merged["properties"].update(resolved["properties"])
-                return self._schema_to_dataclass("AllOf", merged, full_schema)
+                    sub_ref = sub_schema.get("$ref")
+                    resolved = self._resolve_ref(sub_ref, full_schema) if sub_ref is not None else sub_schema
+                    sub_properties = resolved.get("properties")
+                    if sub_properties is not None:
+                        merged["properties"].update(sub_properties)
+                # Every composition gets its own type; reuse of the same schema object
+                # is handled by the id-keyed cache in _schema_to_type_complex
+                self._generated_type_counter += 1
+                name = f"AllOf{self._generated_type_counter}"
+                return self._schema_to_dataclass(name, merged, full_schema)
             return dict
 
         # Handle oneOf/anyOf (simplified: use first schema)
-        if "oneOf" in schema or "anyOf" in schema:
-            schemas = schema.get("oneOf") or schema.get("anyOf", [])
+        one_of = schema.get("oneOf")
+        any_of = schema.get("anyOf")
+        if one_of is not None or any_of is not None:
+            schemas = one_of or any_of
             if schemas:
-                first_schema = (
-                    self._resolve_ref(schemas[0]["$ref"], full_schema) if "$ref" in schemas[0] else schemas[0]
-                )
+                first_schema = schemas[0]
+                first_ref = first_schema.get("$ref")
+                if first_ref is not None:
+                    first_schema = self._resolve_ref(first_ref, full_schema)
                 return self._schema_to_type_complex(first_schema, full_schema)
             return dict
 
         schema_type = schema.get("type", "string")
 
         # Handle format
-        if "format" in schema:
-            format_type = FORMAT_TYPE_MAP.get(schema["format"])
+        schema_format = schema.get("format")
+        if schema_format is not None:
+            format_type = FORMAT_TYPE_MAP.get(schema_format)
             if format_type:
                 return format_type
 
@@ -416,23 +524,15 @@ class OpenAPIExtractor(RouteExtractor):
             properties = schema.get("properties")
             if properties:
                 # Generate a name from the schema title or a unique generated name
-                if "title" in schema:
-                    name = schema["title"]
-                else:
+                name = schema.get("title")
+                if name is None:
                     self._generated_type_counter += 1
                     name = f"GeneratedModel{self._generated_type_counter}"
                 return self._schema_to_dataclass(name, schema, full_schema)
             return dict
 
-        # Handle primitives
-        type_map: dict[str, type] = {
-            "string": str,
-            "integer": int,
-            "number": float,
-            "boolean": bool,
-        }
-
-        return type_map.get(schema_type, str)
+        # Handle primitives (arrays and objects were handled above)
+        return TYPE_MAP.get(schema_type, str)
 
     def _schema_to_dataclass(self, name: str, schema: dict[str, Any], full_schema: dict[str, Any]) -> type:
         """Create a dataclass from JSON schema.
@@ -449,21 +549,31 @@ class OpenAPIExtractor(RouteExtractor):
         if name in self._type_cache:
             return self._type_cache[name]
 
+        # A schema that reaches itself again (e.g. a tree node's children) would
+        # recurse forever; type the back-reference as a plain JSON object instead
+        schema_id = id(schema)
+        if schema_id in self._building:
+            return dict
+
         properties = schema.get("properties", {})
-        required = set(schema.get("required", []))
+        required_names = schema.get("required")
+        required = frozenset(required_names) if required_names else _NO_REQUIRED_FIELDS
 
         # Build field definitions
         fields: list[tuple[str, type] | tuple[str, type, Any]] = []
-        for field_name, field_schema in properties.items():
-            field_type = self._schema_to_type_complex(field_schema, full_schema)
-            is_required = field_name in required
-
-            if is_required:
-                fields.append((field_name, field_type))
-            else:
-                # Optional fields get None default
-                optional_type = Union[field_type, None]  # type: ignore[valid-type]  # noqa: UP007
-                fields.append((field_name, optional_type, None))  # type: ignore[arg-type]
+        self._building.add(schema_id)
+        try:
+            for field_name, field_schema in properties.items():
+                field_type = self._schema_to_type_complex(field_schema, full_schema)
+                is_required = field_name in required
+
+                if is_required:
+                    fields.append((field_name, field_type))
+                else:
+                    # Optional fields get None default
+                    fields.append((field_name, _optional(field_type), None))
+        finally:
+            self._building.discard(schema_id)
 
         # Create dataclass
         dataclass_type = make_dataclass(name, fields if fields else [])
@@ -2,12 +2,45 @@
 
 from __future__ import annotations
 
+import contextlib
 import inspect
 import re
+import weakref
 from typing import Any, get_origin, get_type_hints
 
 from pytest_routes.discovery.base import RouteExtractor, RouteInfo
 
+# Signature and type hints per endpoint. A route with several methods shares one endpoint,
+# and weak keys let endpoints of discarded apps be garbage collected.
+_ENDPOINT_INTROSPECTION: weakref.WeakKeyDictionary[Any, tuple[inspect.Signature, dict[str, Any]]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _introspect_endpoint(endpoint: Any) -> tuple[inspect.Signature, dict[str, Any]]:
+    """Get an endpoint's signature and resolved type hints, cached per endpoint.
+
+    Endpoints that cannot be weakly referenced or hashed are inspected on every call.
+
+    Args:
+        endpoint: The endpoint callable
+
+    Returns:
+        Tuple of the endpoint's signature and its type hints
+
+    Raises:
+        ValueError: If no signature can be determined for the endpoint
+        TypeError: If the endpoint is not supported by inspect.signature
+        NameError: If a type hint refers to an undefined name
+    """
+    with contextlib.suppress(KeyError, TypeError):
+        return _ENDPOINT_INTROSPECTION[endpoint]
+
+    introspection = (inspect.signature(endpoint), get_type_hints(endpoint))
+    with contextlib.suppress(TypeError):
+        _ENDPOINT_INTROSPECTION[endpoint] = introspection
+    return introspection
+
 
 class StarletteExtractor(RouteExtractor):
     """Extract routes from Starlette and FastAPI applications.
@@ -211,8 +244,7 @@ class StarletteExtractor(RouteExtractor):
         query_params: dict[str, type] = {}
 
         try:
-            sig = inspect.signature(endpoint)
-            hints = get_type_hints(endpoint)
+            sig, hints = _introspect_endpoint(endpoint)
         except (ValueError, TypeError, NameError):
             return {}
 
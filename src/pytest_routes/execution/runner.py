@@ -173,13 +173,21 @@ class RouteTestRunner:
         self.app = app
         self.config = config
         self.client = RouteTestClient(app)
-        self._validators: list[ResponseValidator] = []
-        self._init_validators()
+        self._validators = self._build_validators()
 
-    def _init_validators(self) -> None:
-        """Initialize response validators based on config."""
+    def _build_validators(self, allowed_codes: frozenset[int] | None = None) -> list[ResponseValidator]:
+        """Build response validators based on config.
+
+        Args:
+            allowed_codes: Allowed status codes as a frozenset, passed on to the
+                status code validator for fast membership checks.
+
+        Returns:
+            The configured validators, empty if response validation is disabled.
+        """
+        validators: list[ResponseValidator] = []
         if not self.config.validate_responses:
-            return
+            return validators
 
         # Import validators only when needed
         from pytest_routes.validation.response import (
@@ -190,24 +198,12 @@ class RouteTestRunner:
         # Build validators based on config
         for validator_name in self.config.response_validators:
             if validator_name == "status_code":
-                self._validators.append(StatusCodeValidator(self.config.allowed_status_codes))
+                validators.append(StatusCodeValidator(self.config.allowed_status_codes, allowed_set=allowed_codes))
             elif validator_name == "content_type":
-                self._validators.append(ContentTypeValidator())
+                validators.append(ContentTypeValidator())
             # Additional validators can be added here
 
-    def _get_auth_for_route(self, route: RouteInfo) -> AuthProvider | None:
-        """Get the authentication provider for a route.
-
-        Checks for route-specific auth override, then falls back to config auth.
-
-        Args:
-            route: The route to get auth for.
-
-        Returns:
-            AuthProvider if configured, None otherwise.
-        """
-        effective_config = self.config.get_effective_config_for_route(route.path)
-        return effective_config.get("auth")
+        return validators
 
     def _get_auth_type_name(self, auth: AuthProvider | None) -> str | None:
         """Get a descriptive name for the auth type."""
@@ -245,7 +241,10 @@ class RouteTestRunner:
         body_strategy = generate_body(route.body_type)
 
         runner = self
-        auth = self._get_auth_for_route(route)
+        auth = effective_config.get("auth")
+        # Every example checks its status against these; the config is final by now
+        allowed_codes = frozenset(self.config.allowed_status_codes)
+        validators = self._build_validators(allowed_codes)
 
         @settings(
             max_examples=max_examples,
@@ -309,6 +308,8 @@ class RouteTestRunner:
                 body=body,
                 request_headers=auth_headers,
                 auth_type=runner._get_auth_type_name(auth),
+                allowed_codes=allowed_codes,
+                validators=validators,
             )
 
         method = route.methods[0]
@@ -317,12 +318,14 @@ class RouteTestRunner:
 
         return test_route
 
-    def _validate_response(self, response: Any, route: RouteInfo) -> None:
+    def _validate_response(self, response: Any, route: RouteInfo, allowed_codes: frozenset[int] | None = None) -> None:
         """Validate response meets smoke test criteria.
 
         Args:
             response: The HTTP response.
             route: The route that was tested.
+            allowed_codes: Allowed status codes as a frozenset. Defaults to the
+                configured list.
 
         Raises:
             AssertionError: If validation fails.
@@ -333,7 +336,8 @@ class RouteTestRunner:
             raise AssertionError(msg)
 
         # Check allowed status codes
-        if response.status_code not in self.config.allowed_status_codes:
+        allowed = self.config.allowed_status_codes if allowed_codes is None else allowed_codes
+        if response.status_code not in allowed:
             msg = f"Route {route.methods[0]} {route.path} returned unexpected status: {response.status_code}"
             raise AssertionError(msg)
 
@@ -347,6 +351,8 @@ class RouteTestRunner:
         body: Any,
         request_headers: dict[str, str] | None = None,
         auth_type: str | None = None,
+        allowed_codes: frozenset[int] | None = None,
+        validators: list[ResponseValidator] | None = None,
     ) -> None:
         """Validate response with detailed error reporting.
 
@@ -359,10 +365,17 @@ class RouteTestRunner:
             body: Request body used.
             request_headers: Headers that were sent with the request.
             auth_type: Type of authentication used.
+            allowed_codes: Allowed status codes as a frozenset. Defaults to the
+                configured list.
+            validators: Response validators to run. Defaults to the runner's validators.
 
         Raises:
             AssertionError: If validation fails with detailed error.
         """
+        allowed = self.config.allowed_status_codes if allowed_codes is None else allowed_codes
+        if validators is None:
+            validators = self._validators
+
         response_body = None
         with contextlib.suppress(Exception):
             response_body = response.text
@@ -389,7 +402,7 @@ class RouteTestRunner:
             )
             raise AssertionError(failure.format_message())
 
-        if response.status_code not in self.config.allowed_status_codes:
+        if response.status_code not in allowed:
             failure = RouteTestFailure(
                 route_path=route.path,
                 method=route.methods[0],
@@ -407,9 +420,9 @@ class RouteTestRunner:
             )
             raise AssertionError(failure.format_message())
 
-        if self.config.validate_responses and self._validators:
+        if self.config.validate_responses and validators:
             validation_errors = []
-            for validator in self._validators:
+            for validator in validators:
                 result = validator.validate(response, route)
                 if not result.valid:
                     validation_errors.extend(result.errors)
@@ -10,7 +10,7 @@ from typing import TYPE_CHECKING, Any, Union, get_args, get_origin
 from hypothesis import strategies as st
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Generator
+    from collections.abc import Callable, Generator, Iterable
 
     from hypothesis.strategies import SearchStrategy
 
@@ -27,6 +27,21 @@ _TYPE_STRATEGIES: dict[type, Any] = {
 }
 
 
+def _ensure_unregistered(types: Iterable[type]) -> None:
+    """Raise if any of the given types already has a registered strategy.
+
+    Args:
+        types: The Python types about to be registered.
+
+    Raises:
+        ValueError: If a strategy is already registered for one of the types.
+    """
+    for typ in types:
+        if typ in _TYPE_STRATEGIES:
+            msg = f"Strategy for {typ} already registered. Use override=True to replace."
+            raise ValueError(msg)
+
+
 def register_strategy(
     typ: type,
     strategy: SearchStrategy[Any],
@@ -49,9 +64,8 @@ def register_strategy(
         >>> register_strategy(MyType, st.builds(MyType))
         >>> register_strategy(MyType, st.builds(MyType, arg="new"), override=True)
     """
-    if typ in _TYPE_STRATEGIES and not override:
-        msg = f"Strategy for {typ} already registered. Use override=True to replace."
-        raise ValueError(msg)
+    if not override:
+        _ensure_unregistered((typ,))
     _TYPE_STRATEGIES[typ] = strategy
 
 
@@ -157,6 +171,9 @@ def register_strategies(
 ) -> None:
     """Register multiple strategies at once.
 
+    The mapping is checked up front and applied in a single update, so a conflict
+    leaves the registry untouched.
+
     Args:
         mapping: Dictionary mapping types to their strategies.
         override: If True, allow overriding existing strategies. If False (default),
@@ -174,8 +191,9 @@ def register_strategies(
         ...     }
         ... )
     """
-    for typ, strategy in mapping.items():
-        register_strategy(typ, strategy, override=override)
+    if not override:
+        _ensure_unregistered(mapping)
+    _TYPE_STRATEGIES.update(mapping)
 
 
 def strategy_for_type(typ: type) -> SearchStrategy[Any]:  # noqa: PLR0911
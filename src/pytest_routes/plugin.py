@@ -12,6 +12,7 @@ from pytest_routes.config import (
     ReportConfig,
     RouteTestConfig,
     SchemathesisConfig,
+    load_app_path_from_pyproject,
     load_config_from_pyproject,
     merge_configs,
 )
@@ -270,20 +271,7 @@ def pytest_configure(config: pytest.Config) -> None:
             rootdir = Path(config.rootpath) if hasattr(config, "rootpath") else Path.cwd()
             pyproject_path = rootdir / "pyproject.toml"
             if pyproject_path.exists():
-                import sys
-
-                if sys.version_info >= (3, 11):
-                    import tomllib
-                else:
-                    try:
-                        import tomli as tomllib  # type: ignore[import-untyped]
-                    except ImportError:
-                        tomllib = None  # type: ignore[assignment]
-
-                if tomllib is not None:
-                    with open(pyproject_path, "rb") as f:
-                        data = tomllib.load(f)
-                    app_path = data.get("tool", {}).get("pytest-routes", {}).get("app")
+                app_path = load_app_path_from_pyproject(pyproject_path)
         except Exception:
             pass
 
@@ -304,31 +292,7 @@ def pytest_configure(config: pytest.Config) -> None:
     _all_routes = routes.copy()
 
     # Filter routes
-    for route in routes:
-        # Check method filter
-        if not any(m in route_config.methods for m in route.methods):
-            continue
-
-        # Check exclude patterns
-        excluded = False
-        for pattern in route_config.exclude_patterns:
-            if _matches_pattern(route.path, pattern):
-                excluded = True
-                break
-        if excluded:
-            continue
-
-        # Check include patterns (if specified)
-        if route_config.include_patterns:
-            included = False
-            for pattern in route_config.include_patterns:
-                if _matches_pattern(route.path, pattern):
-                    included = True
-                    break
-            if not included:
-                continue
-
-        _discovered_routes.append(route)
+    _discovered_routes.extend(_filter_routes(routes, route_config))
 
     # Create runner
     _route_runner = RouteTestRunner(app, route_config)
@@ -453,49 +417,37 @@ def discovered_routes(asgi_app: Any, route_config: RouteTestConfig) -> list[Rout
     routes = extractor.extract_routes(asgi_app)
 
     # Filter routes based on config
+    return _filter_routes(routes, route_config)
+
+
+@pytest.fixture
+def route_runner(asgi_app: Any, route_config: RouteTestConfig) -> RouteTestRunner:
+    """Provide configured test runner."""
+    return RouteTestRunner(asgi_app, route_config)
+
+
+def _filter_routes(routes: list[RouteInfo], route_config: RouteTestConfig) -> list[RouteInfo]:
+    """Select the routes to test according to the method and path filters."""
+    methods = frozenset(route_config.methods)
     filtered = []
     for route in routes:
         # Check method filter
-        if not any(m in route_config.methods for m in route.methods):
+        if methods.isdisjoint(route.methods):
             continue
 
         # Check exclude patterns
-        excluded = False
-        for pattern in route_config.exclude_patterns:
-            if _matches_pattern(route.path, pattern):
-                excluded = True
-                break
-        if excluded:
+        if route_config.matches_exclude(route.path):
             continue
 
         # Check include patterns (if specified)
-        if route_config.include_patterns:
-            included = False
-            for pattern in route_config.include_patterns:
-                if _matches_pattern(route.path, pattern):
-                    included = True
-                    break
-            if not included:
-                continue
+        if route_config.include_patterns and not route_config.matches_include(route.path):
+            continue
 
         filtered.append(route)
 
     return filtered
 
 
-@pytest.fixture
-def route_runner(asgi_app: Any, route_config: RouteTestConfig) -> RouteTestRunner:
-    """Provide configured test runner."""
-    return RouteTestRunner(asgi_app, route_config)
-
-
-def _matches_pattern(path: str, pattern: str) -> bool:
-    """Check if path matches a glob-like pattern."""
-    import fnmatch
-
-    return fnmatch.fnmatch(path, pattern)
-
-
 class RouteTestItem(pytest.Item):
     """Custom pytest Item for individual route smoke tests.
 
@@ -72,14 +72,18 @@ class StatusCodeValidator:
         >>> assert result.valid
     """
 
-    def __init__(self, allowed_codes: list[int] | None = None) -> None:
+    def __init__(self, allowed_codes: list[int] | None = None, *, allowed_set: frozenset[int] | None = None) -> None:
         """Initialize status code validator.
 
         Args:
             allowed_codes: List of allowed HTTP status codes.
                 Defaults to all 2xx-4xx codes (200-499).
+            allowed_set: The same codes as a frozenset, built by the caller once the
+                codes are final. Used for membership checks when given; the list is
+                then only used for error messages.
         """
         self.allowed_codes = allowed_codes or list(range(200, 500))
+        self._allowed_set = allowed_set
 
     def validate(self, response: Any, route: RouteInfo) -> ValidationResult:
         """Validate response status code.
@@ -92,8 +96,9 @@ class StatusCodeValidator:
             ValidationResult with status code validation.
         """
         status_code = response.status_code
+        allowed = self._allowed_set if self._allowed_set is not None else self.allowed_codes
 
-        if status_code not in self.allowed_codes:
+        if status_code not in allowed:
             max_display = MAX_DISPLAYED_CODES
             codes_display = (
                 f"{self.allowed_codes[:max_display]}{'...' if len(self.allowed_codes) > max_display else ''}"
@@ -54,6 +54,18 @@ class TestBearerTokenAuth:
             headers = auth.get_headers()
             assert headers == {"Authorization": "Bearer env-secret-token"}
 
+    def test_environment_variable_is_read_per_call(self) -> None:
+        auth = BearerTokenAuth("$API_TOKEN")
+        with mock.patch.dict(os.environ, {"API_TOKEN": "first"}):
+            assert auth.get_headers() == {"Authorization": "Bearer first"}
+        with mock.patch.dict(os.environ, {"API_TOKEN": "second"}):
+            assert auth.get_headers() == {"Authorization": "Bearer second"}
+
+    def test_get_headers_returns_fresh_dict(self) -> None:
+        auth = BearerTokenAuth("token")
+        auth.get_headers()["Authorization"] = "tampered"
+        assert auth.get_headers() == {"Authorization": "Bearer token"}
+
     def test_environment_variable_not_set_raises(self) -> None:
         with mock.patch.dict(os.environ, {}, clear=True):
             os.environ.pop("MISSING_TOKEN", None)
@@ -157,6 +169,40 @@ class TestCompositeAuth:
         assert auth.get_headers() == {}
         assert auth.get_query_params() == {}
 
+    def test_single_provider(self) -> None:
+        auth = CompositeAuth([APIKeyAuth("key", query_param="api_key")])
+        assert auth.get_headers() == {}
+        assert auth.get_query_params() == {"api_key": "key"}
+
+    def test_single_provider_result_is_a_copy(self) -> None:
+        class SharedDictAuth(AuthProvider):
+            def __init__(self) -> None:
+                self.headers = {"Authorization": "Bearer shared"}
+                self.params = {"token": "shared"}
+
+            def get_headers(self) -> dict[str, str]:
+                return self.headers
+
+            def get_query_params(self) -> dict[str, str]:
+                return self.params
+
+        provider = SharedDictAuth()
+        auth = CompositeAuth([provider])
+
+        auth.get_headers()["X-Request-ID"] = "1"
+        auth.get_query_params()["page"] = "2"
+
+        assert provider.headers == {"Authorization": "Bearer shared"}
+        assert provider.params == {"token": "shared"}
+
+    def test_providers_added_after_init(self) -> None:
+        auth = CompositeAuth([BearerTokenAuth("my-token")])
+        auth.providers.append(APIKeyAuth("tenant-123", header_name="X-Tenant-ID"))
+        assert auth.get_headers() == {
+            "Authorization": "Bearer my-token",
+            "X-Tenant-ID": "tenant-123",
+        }
+
     def test_mixed_headers_and_query_params(self) -> None:
         auth = CompositeAuth(
             [
@@ -7,7 +7,13 @@ from pathlib import Path
 import pytest
 
 from pytest_routes.auth import BearerTokenAuth
-from pytest_routes.config import RouteOverride, RouteTestConfig, load_config_from_pyproject, merge_configs
+from pytest_routes.config import (
+    RouteOverride,
+    RouteTestConfig,
+    load_app_path_from_pyproject,
+    load_config_from_pyproject,
+    merge_configs,
+)
 
 
 def test_route_test_config_defaults() -> None:
@@ -156,6 +162,50 @@ def test_load_config_from_pyproject_invalid_toml(tmp_path: Path) -> None:
         load_config_from_pyproject(pyproject)
 
 
+def test_load_config_from_pyproject_reuses_parsed_file(tmp_path: Path) -> None:
+    """Test that an unchanged pyproject.toml is only parsed once."""
+    import pytest_routes.config as config_module
+
+    pyproject = tmp_path / "pyproject.toml"
+    pyproject.write_text("""
+[tool.pytest-routes]
+max_examples = 50
+exclude = ["/health"]
+""")
+
+    section = config_module._read_pyproject_section(pyproject)
+    first = load_config_from_pyproject(pyproject)
+    second = load_config_from_pyproject(pyproject)
+
+    assert config_module._read_pyproject_section(pyproject) is section
+    assert second.max_examples == 50
+    assert second is not first
+    assert second.exclude_patterns is not first.exclude_patterns
+
+
+def test_load_config_from_pyproject_reloads_changed_file(tmp_path: Path) -> None:
+    """Test that edits to pyproject.toml are picked up and replace the cached entry."""
+    import pytest_routes.config as config_module
+
+    pyproject = tmp_path / "pyproject.toml"
+    pyproject.write_text("[tool.pytest-routes]\nmax_examples = 50\n")
+    assert load_config_from_pyproject(pyproject).max_examples == 50
+    cache_size = len(config_module._PYPROJECT_CACHE)
+
+    pyproject.write_text("[tool.pytest-routes]\nmax_examples = 250\n")
+    assert load_config_from_pyproject(pyproject).max_examples == 250
+    assert len(config_module._PYPROJECT_CACHE) == cache_size
+
+
+def test_load_app_path_from_pyproject(tmp_path: Path) -> None:
+    """Test reading the app import path from pyproject.toml."""
+    pyproject = tmp_path / "pyproject.toml"
+    assert load_app_path_from_pyproject(pyproject) is None
+
+    pyproject.write_text('[tool.pytest-routes]\napp = "myapp.main:app"\n')
+    assert load_app_path_from_pyproject(pyproject) == "myapp.main:app"
+
+
 def test_merge_configs_no_configs() -> None:
     """Test merging when no configs provided."""
     merged = merge_configs(None, None)
@@ -579,3 +629,37 @@ class TestMergeConfigsWithAuth:
         assert len(merged.route_overrides) == 2
         assert merged.route_overrides[0].pattern == "/api/cli/*"
         assert merged.route_overrides[1].pattern == "/api/file/*"
+
+
+class TestRoutePatternMatching:
+    """Tests for RouteTestConfig include/exclude pattern matching."""
+
+    def test_matches_exclude(self) -> None:
+        config = RouteTestConfig(exclude_patterns=["/health", "/openapi*", "/v?"])
+
+        assert config.matches_exclude("/health")
+        assert config.matches_exclude("/openapi.json")
+        assert config.matches_exclude("/v1")
+        assert not config.matches_exclude("/healthz")
+        assert not config.matches_exclude("/api/openapi")
+        assert not config.matches_exclude("/v10")
+
+    def test_matches_include_without_patterns(self) -> None:
+        config = RouteTestConfig(include_patterns=[])
+
+        assert not config.matches_include("/users")
+
+    def test_matches_include(self) -> None:
+        config = RouteTestConfig(include_patterns=["/api/*", "/users"])
+
+        assert config.matches_include("/api/v1/users/123")
+        assert config.matches_include("/users")
+        assert not config.matches_include("/users/1")
+
+    def test_reassigned_patterns_are_used(self) -> None:
+        config = RouteTestConfig(exclude_patterns=[])
+        assert not config.matches_exclude("/metrics")
+
+        config.exclude_patterns = ["/metrics"]
+
+        assert config.matches_exclude("/metrics")
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import pytest
+
 from pytest_routes.discovery import get_extractor
 
 
@@ -73,6 +75,27 @@ class TestStarletteExtractor:
             assert "user_id" in user_route.path_params
             assert user_route.path_params["user_id"] is int
 
+    def test_inspects_each_endpoint_once(self, monkeypatch):
+        """Test that an endpoint's type hints are resolved once across routes and methods."""
+        from pytest_routes.discovery import starlette
+        from pytest_routes.discovery.starlette import StarletteExtractor
+
+        calls = []
+
+        def counting_get_type_hints(obj):
+            calls.append(obj)
+            return {"limit": int}
+
+        def endpoint(item_id, limit):
+            return None
+
+        monkeypatch.setattr(starlette, "get_type_hints", counting_get_type_hints)
+        extractor = StarletteExtractor()
+
+        for _ in range(3):
+            assert extractor._extract_query_params(endpoint, {"item_id": int}) == {"limit": int}
+        assert calls == [endpoint]
+
 
 class TestFastAPIExtractor:
     """Tests for FastAPI route extraction."""
@@ -91,3 +114,23 @@ class TestFastAPIExtractor:
 
         paths = [r.path for r in routes]
         assert "/" in paths
+
+
+class TestGetExtractor:
+    """Tests for extractor selection."""
+
+    def test_reuses_extractor_for_app_type(self, litestar_app, monkeypatch):
+        """Test that the extractor chosen for an app type is remembered."""
+        from pytest_routes.discovery import litestar
+
+        first = get_extractor(litestar_app)
+        monkeypatch.setattr(litestar.LitestarExtractor, "supports", lambda self, app: False)
+
+        assert type(get_extractor(litestar_app)) is type(first)
+
+    def test_unsupported_app_raises(self):
+        """Test that unknown app types are not cached and still raise."""
+        with pytest.raises(ValueError, match="No route extractor found"):
+            get_extractor(object())
+        with pytest.raises(ValueError, match="No route extractor found"):
+            get_extractor(object())
@@ -275,6 +275,85 @@ class TestOpenAPIBodyExtraction:
         cached_type = extractor._type_cache["UserCreate"]
         assert user_route.body_type == cached_type
 
+    def test_distinct_all_of_compositions_get_distinct_types(self):
+        """Test that different allOf bodies do not share one cached type."""
+        extractor = OpenAPIExtractor()
+        full_schema: dict = {}
+
+        first = extractor._schema_to_type_complex(
+            {"allOf": [{"properties": {"name": {"type": "string"}}}]},
+            full_schema,
+        )
+        second = extractor._schema_to_type_complex(
+            {"allOf": [{"properties": {"count": {"type": "integer"}}}]},
+            full_schema,
+        )
+
+        assert first is not second
+        assert [f.name for f in fields(first)] == ["name"]
+        assert [f.name for f in fields(second)] == ["count"]
+
+    def test_all_of_property_names_do_not_collide(self):
+        """Test that property sets joining to the same string get distinct types."""
+        extractor = OpenAPIExtractor()
+        full_schema: dict = {}
+
+        first = extractor._schema_to_type_complex(
+            {"allOf": [{"properties": {"first_name": {"type": "string"}}}]},
+            full_schema,
+        )
+        second = extractor._schema_to_type_complex(
+            {"allOf": [{"properties": {"first": {"type": "string"}, "name": {"type": "string"}}}]},
+            full_schema,
+        )
+
+        assert first is not second
+        assert [f.name for f in fields(first)] == ["first_name"]
+        assert [f.name for f in fields(second)] == ["first", "name"]
+
+    def test_all_of_same_names_different_types_get_distinct_types(self):
+        """Test that allOf bodies differing only in field types do not share a type."""
+        extractor = OpenAPIExtractor()
+        full_schema: dict = {}
+
+        as_string = extractor._schema_to_type_complex(
+            {"allOf": [{"properties": {"id": {"type": "string"}}}]},
+            full_schema,
+        )
+        as_integer = extractor._schema_to_type_complex(
+            {"allOf": [{"properties": {"id": {"type": "integer"}}}]},
+            full_schema,
+        )
+
+        assert as_string is not as_integer
+        assert {f.name: f.type for f in fields(as_string)}["id"] == str | None
+        assert {f.name: f.type for f in fields(as_integer)}["id"] == int | None
+
+    def test_same_all_of_schema_reuses_type(self):
+        """Test that converting one allOf schema object twice returns one type."""
+        extractor = OpenAPIExtractor()
+        full_schema: dict = {}
+        schema = {"allOf": [{"properties": {"name": {"type": "string"}}}]}
+
+        assert extractor._schema_to_type_complex(schema, full_schema) is extractor._schema_to_type_complex(
+            schema, full_schema
+        )
+
+    def test_shared_inline_schema_converted_once(self):
+        """Test that one inline schema object reused across operations maps to one type."""
+        shared = {"type": "object", "properties": {"limit": {"type": "integer"}}}
+        schema = {
+            "openapi": "3.0.0",
+            "paths": {
+                path: {"post": {"requestBody": {"content": {"application/json": {"schema": shared}}}}}
+                for path in ("/a", "/b")
+            },
+        }
+
+        routes = OpenAPIExtractor(schema=schema).extract_routes(None)
+
+        assert routes[0].body_type is routes[1].body_type
+
 
 class TestOpenAPIReferenceResolution:
     """Tests for $ref resolution."""
@@ -301,6 +380,42 @@ class TestOpenAPIReferenceResolution:
         assert resolved["type"] == "object"
         assert "name" in resolved["properties"]
 
+    def test_ref_resolution_is_per_schema(self):
+        """Test that cached ref targets are not reused across schemas."""
+        first = {"components": {"schemas": {"User": {"type": "object"}}}}
+        second = {"components": {"schemas": {"User": {"type": "string"}}}}
+
+        extractor = OpenAPIExtractor()
+        ref = "#/components/schemas/User"
+
+        assert extractor._resolve_ref(ref, first) is first["components"]["schemas"]["User"]
+        assert extractor._resolve_ref(ref, first) is first["components"]["schemas"]["User"]
+        assert extractor._resolve_ref(ref, second)["type"] == "string"
+
+    def test_self_referencing_schema_terminates(self):
+        """Test that a schema referring to itself does not recurse forever."""
+        full_schema = {
+            "components": {
+                "schemas": {
+                    "Node": {
+                        "type": "object",
+                        "properties": {
+                            "value": {"type": "integer"},
+                            "children": {"type": "array", "items": {"$ref": "#/components/schemas/Node"}},
+                        },
+                        "required": ["value"],
+                    }
+                }
+            }
+        }
+
+        extractor = OpenAPIExtractor()
+        node_type = extractor._schema_to_type_complex({"$ref": "#/components/schemas/Node"}, full_schema)
+
+        field_types = {f.name: f.type for f in fields(node_type)}
+        assert field_types["value"] is int
+        assert field_types["children"] == list[dict] | None
+
     def test_raises_on_external_ref(self):
         """Test that external refs raise an error."""
         schema = {"openapi": "3.0.0", "info": {"title": "Test API", "version": "1.0.0"}}
@@ -337,3 +452,40 @@ class TestBackwardCompatibility:
         assert extractor._schema_to_type({"type": "boolean"}) == bool
         assert extractor._schema_to_type({"type": "array"}) == list
         assert extractor._schema_to_type({"type": "object"}) == dict
+
+    def test_bare_type_leaves_match_complex_conversion(self):
+        """Test that bare {"type": ...} schemas convert the same as the full path."""
+        extractor = OpenAPIExtractor()
+
+        assert extractor._schema_to_type_complex({"type": "integer"}, {}) is int
+        assert extractor._schema_to_type_complex({"type": "array"}, {}) is list
+        assert extractor._schema_to_type_complex({"type": "object"}, {}) is dict
+        assert extractor._schema_to_type_complex({"type": "unknown"}, {}) is str
+
+
+class TestSchemaLoading:
+    """Tests for loading the OpenAPI schema from an application."""
+
+    def test_app_schema_generated_once_per_app(self, sample_openapi_schema):
+        """Test that the app's schema is generated once and reused."""
+
+        class FakeApp:
+            def __init__(self) -> None:
+                self.calls = 0
+
+            def openapi(self) -> dict:
+                self.calls += 1
+                return sample_openapi_schema
+
+        app = FakeApp()
+        extractor = OpenAPIExtractor()
+
+        first = extractor.extract_routes(app)
+        second = extractor.extract_routes(app)
+
+        assert app.calls == 1
+        assert [r.path for r in first] == [r.path for r in second]
+
+        other_app = FakeApp()
+        extractor.extract_routes(other_app)
+        assert other_app.calls == 1
@@ -0,0 +1,31 @@
+"""Tests for the top-level pytest_routes package exports."""
+
+from __future__ import annotations
+
+import pytest
+
+import pytest_routes
+
+
+class TestLazyExports:
+    """Tests for the lazily resolved public API."""
+
+    @pytest.mark.parametrize("name", [n for n in pytest_routes.__all__ if n != "__version__"])
+    def test_all_names_resolve(self, name):
+        """Test that every name in __all__ can be imported from the package."""
+        assert getattr(pytest_routes, name) is not None
+
+    def test_resolves_to_defining_object(self):
+        """Test that lazy exports are the same objects as their submodule definitions."""
+        from pytest_routes.config import RouteTestConfig
+
+        assert pytest_routes.RouteTestConfig is RouteTestConfig
+
+    def test_unknown_attribute_raises(self):
+        """Test that unknown names still raise AttributeError."""
+        with pytest.raises(AttributeError, match="no attribute 'does_not_exist'"):
+            _ = pytest_routes.does_not_exist
+
+    def test_dir_lists_public_names(self):
+        """Test that dir() includes names that have not been imported yet."""
+        assert set(pytest_routes.__all__) <= set(dir(pytest_routes))
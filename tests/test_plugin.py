@@ -3,7 +3,13 @@
 from __future__ import annotations
 
 from pytest_routes.config import RouteTestConfig
-from pytest_routes.plugin import _matches_pattern
+from pytest_routes.discovery.base import RouteInfo
+from pytest_routes.plugin import _filter_routes
+
+
+def _matches_exclude(path: str, pattern: str) -> bool:
+    """Check a path against a single exclude pattern the way route filtering does."""
+    return RouteTestConfig(exclude_patterns=[pattern]).matches_exclude(path)
 
 
 class TestMatchesPattern:
@@ -11,31 +17,31 @@ class TestMatchesPattern:
 
     def test_exact_match(self):
         """Test exact path matching."""
-        assert _matches_pattern("/health", "/health")
-        assert not _matches_pattern("/health", "/healthz")
+        assert _matches_exclude("/health", "/health")
+        assert not _matches_exclude("/health", "/healthz")
 
     def test_wildcard_match(self):
         """Test wildcard pattern matching."""
-        assert _matches_pattern("/api/users", "/api/*")
-        assert _matches_pattern("/api/users/123", "/api/*")
-        assert not _matches_pattern("/users", "/api/*")
+        assert _matches_exclude("/api/users", "/api/*")
+        assert _matches_exclude("/api/users/123", "/api/*")
+        assert not _matches_exclude("/users", "/api/*")
 
     def test_double_wildcard_match(self):
         """Test double wildcard pattern matching."""
-        assert _matches_pattern("/api/v1/users", "/api/**")
-        assert _matches_pattern("/api/v1/users/123/posts", "/api/**")
+        assert _matches_exclude("/api/v1/users", "/api/**")
+        assert _matches_exclude("/api/v1/users/123/posts", "/api/**")
 
     def test_suffix_wildcard(self):
         """Test suffix wildcard matching."""
-        assert _matches_pattern("/openapi.json", "/openapi*")
-        assert _matches_pattern("/openapi", "/openapi*")
-        assert not _matches_pattern("/api/openapi", "/openapi*")
+        assert _matches_exclude("/openapi.json", "/openapi*")
+        assert _matches_exclude("/openapi", "/openapi*")
+        assert not _matches_exclude("/api/openapi", "/openapi*")
 
     def test_question_mark_wildcard(self):
         """Test single character wildcard matching."""
-        assert _matches_pattern("/v1", "/v?")
-        assert _matches_pattern("/v2", "/v?")
-        assert not _matches_pattern("/v10", "/v?")
+        assert _matches_exclude("/v1", "/v?")
+        assert _matches_exclude("/v2", "/v?")
+        assert not _matches_exclude("/v10", "/v?")
 
 
 class TestRouteConfigFixture:
@@ -117,10 +123,27 @@ class TestRouteFiltering:
         routes = extractor.extract_routes(litestar_app)
 
         config = RouteTestConfig(exclude_patterns=["/health"])
-        filtered = [r for r in routes if not any(_matches_pattern(r.path, p) for p in config.exclude_patterns)]
+        filtered = _filter_routes(routes, config)
 
         assert not any(r.path == "/health" for r in filtered)
 
+    def test_filter_routes(self):
+        """Test filtering routes by method, exclude and include patterns together."""
+        routes = [
+            RouteInfo(path="/health", methods=["GET"]),
+            RouteInfo(path="/api/users", methods=["GET"]),
+            RouteInfo(path="/api/users/{user_id}", methods=["DELETE"]),
+            RouteInfo(path="/api/internal", methods=["GET"]),
+            RouteInfo(path="/other", methods=["GET"]),
+        ]
+        config = RouteTestConfig(
+            methods=["GET"],
+            exclude_patterns=["/health", "/api/internal"],
+            include_patterns=["/api/*"],
+        )
+
+        assert [r.path for r in _filter_routes(routes, config)] == ["/api/users"]
+
     def test_include_filtering(self, litestar_app):
         """Test filtering routes by include patterns."""
         from pytest_routes.discovery import get_extractor
@@ -129,6 +152,6 @@ class TestRouteFiltering:
         routes = extractor.extract_routes(litestar_app)
 
         config = RouteTestConfig(include_patterns=["/users/*"])
-        filtered = [r for r in routes if any(_matches_pattern(r.path, p) for p in config.include_patterns)]
+        filtered = _filter_routes(routes, config)
 
         assert all("users" in r.path for r in filtered)
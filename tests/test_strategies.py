@@ -399,6 +399,25 @@ class TestRegisterStrategies:
         # Clean up
         unregister_strategy(MyType)
 
+    def test_register_strategies_is_all_or_nothing(self):
+        """Test that a conflicting batch registers none of its types."""
+
+        class Existing:
+            pass
+
+        class Fresh:
+            pass
+
+        register_strategy(Existing, st.builds(Existing))
+
+        with pytest.raises(ValueError, match="already registered"):
+            register_strategies({Fresh: st.builds(Fresh), Existing: st.builds(Existing)})
+
+        assert Fresh not in get_registered_types()
+
+        # Clean up
+        unregister_strategy(Existing)
+
     def test_register_strategies_override(self):
         """Test batch registration with override."""
 
@@ -151,3 +151,30 @@ def test_validation_with_fail_on_validation_error_false() -> None:
         query_params={},
         body=None,
     )
+
+
+def test_detailed_response_uses_per_route_status_codes() -> None:
+    """Test that the status code set built in create_test is what gets checked."""
+    config = RouteTestConfig(
+        max_examples=1,
+        validate_responses=True,
+        response_validators=["status_code"],
+        allowed_status_codes=[200],
+    )
+    runner = RouteTestRunner(Mock(), config)
+
+    response = Mock()
+    response.status_code = 201
+    response.text = ""
+
+    allowed_codes = frozenset({200, 201})
+    runner._validate_response_detailed(
+        response=response,
+        route=RouteInfo(path="/test", methods=["GET"]),
+        formatted_path="/test",
+        path_params={},
+        query_params={},
+        body=None,
+        allowed_codes=allowed_codes,
+        validators=runner._build_validators(allowed_codes),
+    )
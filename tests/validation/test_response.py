@@ -110,6 +110,23 @@ class TestStatusCodeValidator:
         assert len(result.warnings) == 1
         assert "404" in result.warnings[0]
 
+    def test_allowed_codes_changes_are_honored(self, mock_response: Mock, route_info: RouteInfo) -> None:
+        mock_response.status_code = 503
+        validator = StatusCodeValidator(allowed_codes=[200])
+        validator.allowed_codes.append(503)
+        result = validator.validate(mock_response, route_info)
+        assert result.valid
+
+    def test_allowed_set_used_for_membership(self, mock_response: Mock, route_info: RouteInfo) -> None:
+        mock_response.status_code = 201
+        validator = StatusCodeValidator([200, 201], allowed_set=frozenset({200, 201}))
+        assert validator.validate(mock_response, route_info).valid
+
+        mock_response.status_code = 404
+        result = validator.validate(mock_response, route_info)
+        assert not result.valid
+        assert "[200, 201]" in result.errors[0]
+
 
 class TestContentTypeValidator:
     """Test ContentTypeValidator."""